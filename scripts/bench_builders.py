@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Poker Dream document builders
+Times each builder end to end and per phase (import, construction,
+serialization), scales synthetic inputs (table rows, bullets, slides) to show
+growth curves and records peak RSS. Every run happens in a fresh interpreter
+so import cost and memory are measured cold. Results are written as JSON and
+can be compared against an earlier run.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+
+def build_pptx(size):
+    import create_pptx
+    return create_pptx.build_presentation()
+
+def build_proposal(size):
+    import create_proposal_docx
+    return create_proposal_docx.build_document()
+
+def build_website(size):
+    import create_website_proposal_docx
+    return create_website_proposal_docx.build_document()
+
+def build_proposal_rows(size):
+    import create_proposal_docx
+    milestones = [[f'Milestone {i}', f'Week {i}', f'RM {i * 1000:,}', '1%'] for i in range(size)]
+    return create_proposal_docx.build_document({'milestones': milestones})
+
+def build_table_rows(size):
+    import create_website_proposal_docx
+    from poker_dream_docs.docx_tables import create_styled_table
+    doc, _ = create_website_proposal_docx.base_document('website', create_website_proposal_docx.build_base)
+    rows = [['Item', 'Duration', 'Description', 'Amount']]
+    rows += [[f'Item {i}', f'{i} weeks', 'Synthetic row for benchmarking', f'RM {i * 100:,}'] for i in range(size)]
+    create_styled_table(doc, rows, col_widths=[2, 1.2, 2.3, 1])
+    return doc
+
+def build_bullets(size):
+    import create_website_proposal_docx
+    doc, _ = create_website_proposal_docx.base_document('website', create_website_proposal_docx.build_base)
+    for i in range(size):
+        create_website_proposal_docx.add_bullet_point(doc, f'Synthetic bullet point number {i}')
+    return doc
+
+def build_slides(size):
+    import create_pptx
+    from pptx.util import Inches
+    prs = create_pptx.new_presentation()
+    for i in range(size):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        create_pptx.set_slide_background(slide, create_pptx.COLORS['light_gray'])
+        create_pptx.add_title_text(slide, f'Slide {i}', Inches(0.5), Inches(0.4), Inches(12), Inches(0.8), font_size=36)
+        for j in range(3):
+            create_pptx.add_card(slide, f'Card {j}', ['First point', 'Second point', 'Third point'],
+                                 Inches(0.5 + j * 4.1), Inches(1.5), Inches(3.8), Inches(4))
+    return prs
+
+# Case name -> (modules imported before construction, builder, scales with size)
+CASES = {
+    'pptx': (('create_pptx',), build_pptx, False),
+    'proposal': (('create_proposal_docx',), build_proposal, False),
+    'website': (('create_website_proposal_docx',), build_website, False),
+    'proposal_rows': (('create_proposal_docx',), build_proposal_rows, True),
+    'table_rows': (('create_website_proposal_docx', 'poker_dream_docs.docx_tables'), build_table_rows, True),
+    'bullets': (('create_website_proposal_docx',), build_bullets, True),
+    'slides': (('create_pptx',), build_slides, True),
+}
+
+def run_case(name, size):
+    """Run one case in this (fresh) process and return its measurements"""
+    from poker_dream_docs.doc_output import save_document
+
+    modules, build, _ = CASES[name]
+    start = time.perf_counter()
+    for module in modules:
+        importlib.import_module(module)
+    imported = time.perf_counter()
+    document = build(size)
+    built = time.perf_counter()
+    data = save_document(document, None)
+    saved = time.perf_counter()
+
+    return {
+        'case': name,
+        'size': size,
+        'import_s': imported - start,
+        'build_s': built - imported,
+        'save_s': saved - built,
+        'total_s': saved - start,
+        'bytes': len(data),
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == 'darwin' else 1),
+    }
+
+def run_benchmarks(cases, sizes, repeat):
+    """Run every case/size/repeat in its own spawned interpreter"""
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+        for name in cases:
+            for size in (sizes if CASES[name][2] else [None]):
+                for run in range(repeat):
+                    result = executor.submit(run_case, name, size).result()
+                    result['run'] = run
+                    results.append(result)
+                    label = name if size is None else f'{name}[{size}]'
+                    print(f"{label:24} import {result['import_s']:7.3f}s  build {result['build_s']:7.3f}s  "
+                          f"save {result['save_s']:7.3f}s  {result['bytes'] / 1024:8.1f} KiB  "
+                          f"rss {result['peak_rss_kb'] / 1024:6.1f} MiB")
+    return results
+
+def summarize(results):
+    """Return {(case, size): best total seconds} over repeats"""
+    best = {}
+    for result in results:
+        key = (result['case'], result['size'])
+        best[key] = min(best.get(key, float('inf')), result['total_s'])
+    return best
+
+def compare(results, baseline_path, threshold):
+    """Print per-case change against a baseline file; return True if none regressed"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = summarize(json.load(f)['results'])
+    current = summarize(results)
+    ok = True
+    for key, seconds in sorted(current.items(), key=lambda item: (item[0][0], item[0][1] or 0)):
+        if key not in baseline:
+            continue
+        change = (seconds - baseline[key]) / baseline[key]
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            ok = False
+        label = key[0] if key[1] is None else f'{key[0]}[{key[1]}]'
+        print(f'{label:24} {baseline[key]:7.3f}s -> {seconds:7.3f}s  {change:+7.1%}{flag}')
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Poker Dream document builders')
+    parser.add_argument('--cases', nargs='*', choices=sorted(CASES), default=list(CASES), help='Cases to run')
+    parser.add_argument('--sizes', nargs='*', type=int, default=[10, 100, 1000], help='Input sizes for scaling cases')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case and size')
+    parser.add_argument('--output', default='bench_results.json', help='Where to write JSON results')
+    parser.add_argument('--compare', help='Baseline JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.cases, args.sizes, args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'results': results,
+        }, f, indent=2)
+    print(f'Results saved to: {args.output}')
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -4,102 +4,41 @@ Generate a professionally designed Word document for Poker Dream Business Propos
 Single delivery version - no phases
 """
 
-from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
+from docx.shared import Pt, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from poker_dream_docs.docx_helpers import (
+    ACCENT_COLOR, DANGER_COLOR, PRIMARY_COLOR, SUCCESS_COLOR, TEXT_COLOR,
+    add_bullet_point, add_h3_header, add_labeled_text, add_page_break, add_paragraph_text,
+    add_section_header, add_subsection_header,
+)
+from poker_dream_docs.doc_output import save_bytes, save_document, is_path
+from poker_dream_docs.docx_styles import add_styled_paragraph, ensure_styles
+from poker_dream_docs.docx_section_cache import render_cached
+from poker_dream_docs.docx_tables import create_styled_table, ensure_table_style
+from poker_dream_docs.docx_template_cache import base_document
+from poker_dream_docs.manifest import DEFAULT_CLIENT, load_manifest, output_filename, validate_manifest
+from poker_dream_docs.pdf_export import is_pdf, pdf_filename, render_pdf, save_pdf
+from poker_dream_docs.render_cache import cached_render, format_stats
+import argparse
 import os
 
-# Brand Colors
-PRIMARY_COLOR = RGBColor(0x2C, 0x3E, 0x50)      # Dark Blue
-SECONDARY_COLOR = RGBColor(0x34, 0x49, 0x5E)   # Slate
-ACCENT_COLOR = RGBColor(0xC0, 0xA0, 0x62)      # Gold
-TEXT_COLOR = RGBColor(0x33, 0x33, 0x33)        # Dark Gray
-SUCCESS_COLOR = RGBColor(0x27, 0xAE, 0x60)     # Green
-DANGER_COLOR = RGBColor(0xC0, 0x39, 0x2B)      # Red
-
-def set_cell_shading(cell, color):
-    """Set cell background color"""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
-
-def add_horizontal_line(doc):
-    """Add a horizontal line"""
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    pPr = p._p.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), 'C0A062')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
-
-def create_styled_table(doc, data, header=True, col_widths=None):
-    """Create a professionally styled table"""
-    table = doc.add_table(rows=len(data), cols=len(data[0]))
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
-    for i, row_data in enumerate(data):
-        row = table.rows[i]
-        for j, cell_text in enumerate(row_data):
-            cell = row.cells[j]
-            cell.text = str(cell_text)
-
-            for paragraph in cell.paragraphs:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                for run in paragraph.runs:
-                    run.font.size = Pt(10)
-                    run.font.name = 'Calibri'
-                    if i == 0 and header:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-
-            if i == 0 and header:
-                set_cell_shading(cell, '2C3E50')
-            elif i % 2 == 0:
-                set_cell_shading(cell, 'F8F9FA')
-
-    if col_widths:
-        for i, width in enumerate(col_widths):
-            for cell in table.columns[i].cells:
-                cell.width = Inches(width)
-
-    return table
-
-def add_section_header(doc, title):
-    """Add a section header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
-    run.font.size = Pt(18)
-    run.font.bold = True
-    run.font.color.rgb = PRIMARY_COLOR
-    add_horizontal_line(doc)
+OUTPUT_PATH = 'POKER_DREAM_PROPOSAL.docx'
 
-def add_subsection_header(doc, title):
-    """Add a subsection header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
-    run.font.size = Pt(14)
-    run.font.bold = True
-    run.font.color.rgb = SECONDARY_COLOR
-
-def add_h3_header(doc, title):
-    """Add a h3 header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
+def add_cover_info(p, label, value):
+    """Fill a centered label/value line on the cover page"""
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = p.add_run(f'{label} ')
     run.font.size = Pt(12)
     run.font.bold = True
-    run.font.color.rgb = SECONDARY_COLOR
+    run.font.color.rgb = TEXT_COLOR
+    run = p.add_run(value)
+    run.font.size = Pt(12)
+    run.font.color.rgb = TEXT_COLOR
 
-def main():
-    doc = Document()
+def build_base(doc, version, date, validity):
+    """Set up brand styles, margins, cover page and table of contents"""
+    ensure_styles(doc)
+    ensure_table_style(doc)
 
     # Set up document margins
     sections = doc.sections
@@ -133,26 +72,19 @@ def main():
     doc.add_paragraph()
     doc.add_paragraph()
     doc.add_paragraph()
-    doc.add_paragraph()
+    # Last spacer doubles as the per-client "Prepared for" line
+    client_slot = doc.add_paragraph()
 
     info_data = [
-        ['Version:', '2.0'],
-        ['Date:', '5 December 2025'],
-        ['Validity:', '30 days (until 5 January 2026)'],
+        ['Version:', version],
+        ['Date:', date],
+        ['Validity:', validity],
     ]
 
     for label, value in info_data:
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(f'{label} ')
-        run.font.size = Pt(12)
-        run.font.bold = True
-        run.font.color.rgb = TEXT_COLOR
-        run = p.add_run(value)
-        run.font.size = Pt(12)
-        run.font.color.rgb = TEXT_COLOR
-
-    doc.add_page_break()
+        add_cover_info(doc.add_paragraph(), label, value)
+
+    add_page_break(doc)
 
     # ==================== TABLE OF CONTENTS ====================
     add_section_header(doc, 'Table of Contents')
@@ -171,22 +103,18 @@ def main():
     ]
 
     for item in toc_items:
-        p = doc.add_paragraph()
-        p.paragraph_format.left_indent = Inches(0.5)
-        p.paragraph_format.space_after = Pt(8)
-        run = p.add_run(item)
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_styled_paragraph(doc, 'PDTOCItem', item)
+
+    add_page_break(doc)
 
-    doc.add_page_break()
+    return {'client_name': client_slot}
 
+def add_executive_summary(doc):
+    """Executive summary section"""
     # ==================== 1. EXECUTIVE SUMMARY ====================
     add_section_header(doc, '1. Executive Summary')
 
-    p = doc.add_paragraph()
-    run = p.add_run('Poker Dream is an innovative mobile application designed specifically for poker lovers in Malaysia and around the world. The app offers a unique combination of tournament management, poker news, and engaging video content all in one platform.')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'Poker Dream is an innovative mobile application designed specifically for poker lovers in Malaysia and around the world. The app offers a unique combination of tournament management, poker news, and engaging video content all in one platform.')
 
     doc.add_paragraph()
 
@@ -202,6 +130,8 @@ def main():
 
     doc.add_paragraph()
 
+def add_goals_outcomes(doc):
+    """Goals & outcomes section"""
     # ==================== 2. GOALS & OUTCOMES ====================
     add_section_header(doc, '2. Goals & Outcomes')
 
@@ -214,14 +144,7 @@ def main():
     ]
 
     for label, desc in vision_items:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {label} ')
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = PRIMARY_COLOR
-        run = p.add_run(desc)
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_labeled_text(doc, f'• {label} ', desc)
 
     doc.add_paragraph()
 
@@ -236,61 +159,42 @@ def main():
 
     doc.add_paragraph()
 
+def add_what_you_get(doc):
+    """What you get section"""
     # ==================== 3. WHAT YOU GET ====================
     add_section_header(doc, '3. What You Get')
 
     add_subsection_header(doc, 'A) Mobile Application (iOS & Android)')
 
-    p = doc.add_paragraph()
-    run = p.add_run('A native-feel app that works on both platforms:')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'A native-feel app that works on both platforms:')
 
     doc.add_paragraph()
 
     add_h3_header(doc, 'Home Screen')
     for item in ['Highlight video carousel with auto-play previews', 'Quick-access grid for Events, News, Videos, and more', 'Latest news headlines']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     add_h3_header(doc, 'Tournaments / Series')
     for item in ['List of upcoming, live, and completed events', 'Search, filter by date range, buy-in, game type', 'Detail pages with description, schedule, prize pool']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     add_h3_header(doc, 'News')
     for item in ['Article feed sorted by recency or category', 'Full article reader with images, author info']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     add_h3_header(doc, 'Videos')
     for item in ['Video gallery with thumbnails and durations', 'In-app playback (or YouTube redirect)']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     add_h3_header(doc, 'User Account')
     for item in ['Email/password authentication (email verification)', 'Profile screen with avatar and display name']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
     add_subsection_header(doc, 'B) Admin Dashboard (Web)')
 
-    p = doc.add_paragraph()
-    run = p.add_run('A secure management console for your team:')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'A secure management console for your team:')
 
     doc.add_paragraph()
 
@@ -304,10 +208,7 @@ def main():
     for section_title, items in admin_features:
         add_h3_header(doc, section_title)
         for item in items:
-            p = doc.add_paragraph()
-            run = p.add_run(f'• {item}')
-            run.font.size = Pt(11)
-            run.font.color.rgb = TEXT_COLOR
+            add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
@@ -323,14 +224,12 @@ def main():
 
     doc.add_paragraph()
 
-    p = doc.add_paragraph()
-    run = p.add_run('Everything is deployed on your cloud account for full ownership.')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'Everything is deployed on your cloud account for full ownership.', italic=True)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
+def add_project_timeline(doc):
+    """Project timeline section"""
     # ==================== 4. PROJECT TIMELINE ====================
     add_section_header(doc, '4. Project Timeline (12 Weeks)')
 
@@ -345,31 +244,23 @@ def main():
 
     doc.add_paragraph()
 
-    p = doc.add_paragraph()
-    run = p.add_run('Our target is to submit to the app stores by Week 12, subject to platform review times.')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = PRIMARY_COLOR
+    add_paragraph_text(doc, 'Our target is to submit to the app stores by Week 12, subject to platform review times.', bold=True, color=PRIMARY_COLOR)
 
     doc.add_paragraph()
 
     add_subsection_header(doc, 'Communication & Reporting')
 
     for item in ['Simple weekly progress report', 'Short demo every two weeks', 'Transparent issue tracking with real-time access']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
+def add_capacity_fit(doc):
+    """Capacity fit section"""
     # ==================== 5. CAPACITY FIT ====================
     add_section_header(doc, '5. Capacity Fit')
 
-    p = doc.add_paragraph()
-    run = p.add_run("We're confident we can deliver a high-quality poker platform because:")
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, "We're confident we can deliver a high-quality poker platform because:")
 
     doc.add_paragraph()
 
@@ -383,15 +274,14 @@ def main():
 
     doc.add_paragraph()
 
+def add_responsibilities(doc):
+    """Client responsibilities section"""
     # ==================== 6. YOUR RESPONSIBILITIES ====================
     add_section_header(doc, '6. Your Responsibilities')
 
     add_subsection_header(doc, 'Simple Checklist')
 
-    p = doc.add_paragraph()
-    run = p.add_run('To ensure smooth delivery, we need you to:')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'To ensure smooth delivery, we need you to:')
 
     doc.add_paragraph()
 
@@ -404,30 +294,22 @@ def main():
     ]
 
     for item in checklist:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
     add_subsection_header(doc, 'Timely Feedback Required')
 
-    p = doc.add_paragraph()
-    run = p.add_run('This timeline requires your feedback within 3 business days on all deliverables. Delays in approval will extend the project timeline accordingly.')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'This timeline requires your feedback within 3 business days on all deliverables. Delays in approval will extend the project timeline accordingly.', italic=True)
 
     doc.add_paragraph()
 
+def add_maintenance_support(doc):
+    """Maintenance & support tiers section"""
     # ==================== 7. MAINTENANCE & SUPPORT ====================
     add_section_header(doc, '7. Maintenance & Support')
 
-    p = doc.add_paragraph()
-    run = p.add_run('Once launched, we offer two support tiers:')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'Once launched, we offer two support tiers:')
 
     doc.add_paragraph()
 
@@ -457,14 +339,12 @@ def main():
 
     doc.add_paragraph()
 
-    p = doc.add_paragraph()
-    run = p.add_run('Both plans include hosting monitoring, security patches, and routine backups.')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'Both plans include hosting monitoring, security patches, and routine backups.', italic=True)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
+def add_pricing_payment(doc, pricing, milestones):
+    """Pricing & payment section"""
     # ==================== 8. PRICING & PAYMENT ====================
     add_section_header(doc, '8. Pricing & Payment')
 
@@ -472,9 +352,7 @@ def main():
 
     create_styled_table(doc, [
         ['Item', 'Amount'],
-        ['Total Development Fee', 'RM 250,000 (one-time)'],
-        ['Monthly Support', 'RM 11,000 – RM 20,000 depending on option'],
-    ], col_widths=[3, 3.5])
+    ] + pricing, col_widths=[3, 3.5])
 
     doc.add_paragraph()
 
@@ -482,11 +360,7 @@ def main():
 
     create_styled_table(doc, [
         ['Milestone', 'Timing', 'Amount', 'Percentage'],
-        ['Contract Signing', 'Upon signing', 'RM 62,500', '25%'],
-        ['Backend Complete', 'Week 5', 'RM 75,000', '30%'],
-        ['Admin + Mobile Alpha', 'Week 9', 'RM 75,000', '30%'],
-        ['Final Delivery', 'Week 12', 'RM 37,500', '15%'],
-    ], col_widths=[2.2, 1.5, 1.5, 1.3])
+    ] + milestones, col_widths=[2.2, 1.5, 1.5, 1.3])
 
     doc.add_paragraph()
 
@@ -503,10 +377,7 @@ def main():
     ]
 
     for item in included:
-        p = doc.add_paragraph()
-        run = p.add_run(f'✓ {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = SUCCESS_COLOR
+        add_bullet_point(doc, item, color=SUCCESS_COLOR, marker='✓')
 
     doc.add_paragraph()
 
@@ -520,30 +391,23 @@ def main():
     ]
 
     for item in not_included:
-        p = doc.add_paragraph()
-        run = p.add_run(f'✗ {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = DANGER_COLOR
+        add_bullet_point(doc, item, color=DANGER_COLOR, marker='✗')
 
     doc.add_paragraph()
 
     add_subsection_header(doc, 'Growth & Usage-Based Costs')
 
-    p = doc.add_paragraph()
-    run = p.add_run('As your user base grows, third-party provider charges (cloud compute, media storage, email/push sends) may increase. We will:')
-    run.font.size = Pt(11)
-    run.font.color.rgb = TEXT_COLOR
+    add_paragraph_text(doc, 'As your user base grows, third-party provider charges (cloud compute, media storage, email/push sends) may increase. We will:')
 
     doc.add_paragraph()
 
     for item in ['Enable spend alerts and budgets in your accounts', 'Provide a simple monthly forecast', 'Optimize caching/CDN to minimize costs']:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
+def add_data_privacy(doc):
+    """Data & privacy section"""
     # ==================== 9. DATA & PRIVACY ====================
     add_section_header(doc, '9. Data & Privacy')
 
@@ -558,13 +422,12 @@ def main():
     ]
 
     for item in privacy_items:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_bullet_point(doc, item)
 
     doc.add_paragraph()
 
+def add_acceptance(doc):
+    """Acceptance & next steps section"""
     # ==================== 10. ACCEPTANCE & NEXT STEPS ====================
     add_section_header(doc, '10. Acceptance & Next Steps')
 
@@ -577,17 +440,12 @@ def main():
     ]
 
     for step, desc in steps:
-        p = doc.add_paragraph()
-        run = p.add_run(step + ' ')
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = ACCENT_COLOR
-        run = p.add_run(desc)
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_labeled_text(doc, step + ' ', desc, label_color=ACCENT_COLOR)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
+def add_signatures(doc):
+    """Signature blocks and closing lines section"""
     # ==================== SIGNATURES ====================
     add_section_header(doc, 'Signatures')
 
@@ -596,13 +454,7 @@ def main():
     sig_fields = ['Name:', 'Title:', 'Signature:', 'Date:']
 
     for field in sig_fields:
-        p = doc.add_paragraph()
-        run = p.add_run(field)
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = TEXT_COLOR
-        run = p.add_run(' ' + '_' * 50)
-        run.font.size = Pt(11)
+        p = add_labeled_text(doc, field, ' ' + '_' * 50, label_color=TEXT_COLOR)
         p.paragraph_format.space_after = Pt(14)
 
     doc.add_paragraph()
@@ -610,13 +462,7 @@ def main():
     add_subsection_header(doc, 'Service Provider')
 
     for field in sig_fields:
-        p = doc.add_paragraph()
-        run = p.add_run(field)
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = TEXT_COLOR
-        run = p.add_run(' ' + '_' * 50)
-        run.font.size = Pt(11)
+        p = add_labeled_text(doc, field, ' ' + '_' * 50, label_color=TEXT_COLOR)
         p.paragraph_format.space_after = Pt(14)
 
     doc.add_paragraph()
@@ -639,10 +485,132 @@ def main():
     run.font.bold = True
     run.font.color.rgb = ACCENT_COLOR
 
-    # Save document
-    output_path = '/Users/clifflai/development/vsc-workspace/poker-dream/POKER_DREAM_PROPOSAL.docx'
-    doc.save(output_path)
-    print(f'Document saved to: {output_path}')
+# Body sections in document order, with the client fields each one renders
+SECTIONS = [
+    (add_executive_summary, ()),
+    (add_goals_outcomes, ()),
+    (add_what_you_get, ()),
+    (add_project_timeline, ()),
+    (add_capacity_fit, ()),
+    (add_responsibilities, ()),
+    (add_maintenance_support, ()),
+    (add_pricing_payment, ('pricing', 'milestones')),
+    (add_data_privacy, ()),
+    (add_acceptance, ()),
+    (add_signatures, ()),
+]
+
+def build_document(client=None, cache_dir=None):
+    """Build the proposal for one client and return the Document
+
+    With cache_dir, sections whose builder code and inputs are unchanged are
+    spliced in from their cached fragments instead of being re-rendered.
+    """
+    client = {**DEFAULT_CLIENT, **(client or {})}
+    cover = (client['version'], client['date'], client['validity'])
+    doc, slots = base_document(('proposal',) + cover, build_base, *cover)
+
+    if client['client_name']:
+        add_cover_info(slots['client_name'], 'Prepared for:', client['client_name'])
+
+    for add_section, fields in SECTIONS:
+        inputs = [client[field] for field in fields]
+        if cache_dir:
+            render_cached(doc, cache_dir, add_section, *inputs)
+        else:
+            add_section(doc, *inputs)
+
+    return doc
+
+def cached_proposal(client=None, cache_dir=None, render_cache=None, stats=None, pdf=False):
+    """Return one client's proposal as .docx (or PDF) bytes, reusing an identical earlier render
+
+    The render cache key covers every client field except the output name.
+    Cached documents are always saved reproducibly.
+    """
+    fields = {**DEFAULT_CLIENT, **(client or {})}
+    fields.pop('output', None)
+    if pdf:
+        data, _ = cached_render(render_cache, 'proposal.pdf', fields,
+                                lambda: render_pdf(build_document(client, cache_dir)), stats=stats)
+    else:
+        data, _ = cached_render(render_cache, 'proposal', fields,
+                                lambda: save_document(build_document(client, cache_dir), reproducible=True),
+                                stats=stats)
+    return data
+
+def create_proposal(client=None, output=OUTPUT_PATH, cache_dir=None, render_cache=None, reproducible=None,
+                    pdf=None):
+    """Build one client's proposal and save it to a path or file-like object
+
+    With output=None the .docx bytes are returned instead. With render_cache,
+    a proposal already rendered from the same inputs is served from that
+    directory. pdf exports the same document as PDF; it defaults to on when
+    output is a path ending in .pdf.
+    """
+    if pdf is None:
+        pdf = is_pdf(output)
+    if render_cache:
+        result = save_bytes(cached_proposal(client, cache_dir, render_cache, pdf=pdf), output)
+    elif pdf:
+        result = save_pdf(build_document(client, cache_dir), output)
+    else:
+        result = save_document(build_document(client, cache_dir), output, reproducible=reproducible)
+    if is_path(output):
+        print(f'Document saved to: {output}')
+    return result
+
+def render_batch(manifest_path, output_dir, cache_dir=None, render_cache=None, reproducible=None, pdf=False):
+    """Render one proposal per manifest row in this process (as PDF files with pdf)
+
+    The manifest is validated first; any problem, such as two rows naming the
+    same output file, raises ValueError before anything is written.
+    """
+    clients = load_manifest(manifest_path)
+    errors = validate_manifest(clients)
+    if errors:
+        raise ValueError('\n'.join(f'{manifest_path}: {error}' for error in errors))
+    os.makedirs(output_dir, exist_ok=True)
+    output_paths = []
+    stats = {}
+    for index, client in enumerate(clients):
+        filename = output_filename(client, index)
+        output_path = os.path.join(output_dir, pdf_filename(filename) if pdf else filename)
+        if render_cache:
+            save_bytes(cached_proposal(client, cache_dir, render_cache, stats, pdf), output_path)
+        elif pdf:
+            save_pdf(build_document(client, cache_dir), output_path)
+        else:
+            save_document(build_document(client, cache_dir), output_path, reproducible=reproducible)
+        output_paths.append(output_path)
+    print(f'{len(output_paths)} documents saved to: {output_dir}')
+    if render_cache:
+        print(format_stats(stats))
+    return output_paths
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the Poker Dream business proposal')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help='Output .docx or .pdf path, or - for stdout')
+    parser.add_argument('--manifest', help='CSV or JSONL file with one client per row (batch mode)')
+    parser.add_argument('--output-dir', default='.', help='Directory for batch mode output')
+    parser.add_argument('--cache-dir', help='Reuse rendered sections cached in this directory')
+    parser.add_argument('--render-cache', help='Reuse whole documents rendered from the same inputs in this directory')
+    parser.add_argument('--reproducible', action='store_true', default=None,
+                        help='Pin timestamps so identical content gives identical bytes (default: on if SOURCE_DATE_EPOCH is set)')
+    parser.add_argument('--pdf', action='store_true', default=None,
+                        help='Export PDF instead of .docx (default: on if the output path ends in .pdf)')
+    args = parser.parse_args()
+
+    if args.manifest:
+        try:
+            render_batch(args.manifest, args.output_dir, args.cache_dir, args.render_cache, args.reproducible,
+                         bool(args.pdf))
+        except ValueError as e:
+            parser.exit(1, f'{e}\n')
+        return
+
+    create_proposal(output=args.output, cache_dir=args.cache_dir, render_cache=args.render_cache,
+                    reproducible=args.reproducible, pdf=args.pdf)
 
 if __name__ == '__main__':
     main()
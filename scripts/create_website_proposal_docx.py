@@ -3,118 +3,26 @@
 Generate a professionally designed Word document for Poker Dream Website Development Proposal
 """
 
-from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
+from docx.shared import Pt, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-import os
-
-# Brand Colors
-PRIMARY_COLOR = RGBColor(0x2C, 0x3E, 0x50)      # Dark Blue
-SECONDARY_COLOR = RGBColor(0x34, 0x49, 0x5E)   # Slate
-ACCENT_COLOR = RGBColor(0xC0, 0xA0, 0x62)      # Gold
-TEXT_COLOR = RGBColor(0x33, 0x33, 0x33)        # Dark Gray
-SUCCESS_COLOR = RGBColor(0x27, 0xAE, 0x60)     # Green
-DANGER_COLOR = RGBColor(0xC0, 0x39, 0x2B)      # Red
-
-def set_cell_shading(cell, color):
-    """Set cell background color"""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
-
-def add_horizontal_line(doc):
-    """Add a horizontal line"""
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    pPr = p._p.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), 'C0A062')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
-
-def create_styled_table(doc, data, header=True, col_widths=None):
-    """Create a professionally styled table"""
-    table = doc.add_table(rows=len(data), cols=len(data[0]))
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
-    for i, row_data in enumerate(data):
-        row = table.rows[i]
-        for j, cell_text in enumerate(row_data):
-            cell = row.cells[j]
-            cell.text = str(cell_text)
-
-            for paragraph in cell.paragraphs:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                for run in paragraph.runs:
-                    run.font.size = Pt(10)
-                    run.font.name = 'Calibri'
-                    if i == 0 and header:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-
-            if i == 0 and header:
-                set_cell_shading(cell, '2C3E50')
-            elif i % 2 == 0:
-                set_cell_shading(cell, 'F8F9FA')
-
-    if col_widths:
-        for i, width in enumerate(col_widths):
-            for cell in table.columns[i].cells:
-                cell.width = Inches(width)
-
-    return table
-
-def add_section_header(doc, title):
-    """Add a section header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
-    run.font.size = Pt(18)
-    run.font.bold = True
-    run.font.color.rgb = PRIMARY_COLOR
-    add_horizontal_line(doc)
-
-def add_subsection_header(doc, title):
-    """Add a subsection header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
-    run.font.size = Pt(14)
-    run.font.bold = True
-    run.font.color.rgb = SECONDARY_COLOR
-
-def add_h3_header(doc, title):
-    """Add a h3 header"""
-    p = doc.add_paragraph()
-    run = p.add_run(title)
-    run.font.size = Pt(12)
-    run.font.bold = True
-    run.font.color.rgb = SECONDARY_COLOR
-
-def add_bullet_point(doc, text, color=TEXT_COLOR):
-    """Add a bullet point"""
-    p = doc.add_paragraph()
-    run = p.add_run(f'• {text}')
-    run.font.size = Pt(11)
-    run.font.color.rgb = color
-
-def add_paragraph_text(doc, text, bold=False, italic=False, color=TEXT_COLOR):
-    """Add paragraph text"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.size = Pt(11)
-    run.font.bold = bold
-    run.font.italic = italic
-    run.font.color.rgb = color
-
-def main():
-    doc = Document()
+from poker_dream_docs.docx_helpers import (
+    ACCENT_COLOR, DANGER_COLOR, PRIMARY_COLOR, SECONDARY_COLOR, SUCCESS_COLOR, TEXT_COLOR,
+    add_bullet_point, add_labeled_text, add_page_break, add_paragraph_text, add_section_header,
+    add_subsection_header,
+)
+from poker_dream_docs.doc_output import save_bytes, save_document, is_path
+from poker_dream_docs.docx_styles import ensure_styles
+from poker_dream_docs.docx_tables import create_styled_table
+from poker_dream_docs.docx_template_cache import base_document
+from poker_dream_docs.pdf_export import is_pdf, render_pdf, save_pdf
+from poker_dream_docs.render_cache import cached_render
+import argparse
+
+OUTPUT_PATH = 'Poker_Dream_Website_Proposal.docx'
+
+def build_base(doc):
+    """Set up brand styles, margins and cover page"""
+    ensure_styles(doc)
 
     # Set up document margins
     sections = doc.sections
@@ -182,7 +90,11 @@ def main():
         run.font.size = Pt(12)
         run.font.color.rgb = TEXT_COLOR
 
-    doc.add_page_break()
+    add_page_break(doc)
+
+def build_document():
+    """Build the website proposal and return the Document"""
+    doc, _ = base_document('website', build_base)
 
     # ==================== EXECUTIVE SUMMARY ====================
     add_section_header(doc, 'EXECUTIVE SUMMARY')
@@ -211,7 +123,7 @@ def main():
         'with your existing Poker Dream backend APIs. The website will share data models with your Flutter '
         'mobile app, ensuring consistency across all platforms.')
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== PROJECT SCOPE ====================
     add_section_header(doc, 'PROJECT SCOPE')
@@ -255,7 +167,7 @@ def main():
         ['SEO & Performance', 'Server-side rendering, Meta tags optimization, Google Analytics integration'],
     ], col_widths=[2.5, 4])
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== TECHNICAL APPROACH ====================
     add_section_header(doc, 'TECHNICAL APPROACH')
@@ -278,14 +190,7 @@ def main():
     ]
 
     for label, desc in benefits:
-        p = doc.add_paragraph()
-        run = p.add_run(f'• {label}: ')
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = PRIMARY_COLOR
-        run = p.add_run(desc)
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        add_labeled_text(doc, f'• {label}: ', desc)
 
     doc.add_paragraph()
 
@@ -302,7 +207,7 @@ def main():
         ['Analytics', 'Google Analytics 4'],
     ], col_widths=[2.5, 4])
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== TIMELINE ====================
     add_section_header(doc, 'PROJECT TIMELINE')
@@ -364,7 +269,7 @@ def main():
         ['DevOps', 'CI/CD pipeline, staging/production environments'],
     ], col_widths=[2.5, 4])
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== CAPACITY FIT ====================
     add_section_header(doc, 'CAPACITY FIT')
@@ -386,7 +291,7 @@ def main():
         'This architecture comfortably supports your scale, with headroom for traffic spikes during '
         'major events. The CDN and caching strategy ensures fast load times globally.')
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== INVESTMENT SUMMARY ====================
     add_section_header(doc, 'INVESTMENT SUMMARY')
@@ -443,10 +348,7 @@ def main():
     ]
 
     for item in included:
-        p = doc.add_paragraph()
-        run = p.add_run(f'✓ {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = SUCCESS_COLOR
+        add_bullet_point(doc, item, color=SUCCESS_COLOR, marker='✓')
 
     doc.add_paragraph()
 
@@ -461,12 +363,9 @@ def main():
     ]
 
     for item in not_included:
-        p = doc.add_paragraph()
-        run = p.add_run(f'✗ {item}')
-        run.font.size = Pt(11)
-        run.font.color.rgb = DANGER_COLOR
+        add_bullet_point(doc, item, color=DANGER_COLOR, marker='✗')
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== MONTHLY RECURRING COSTS ====================
     add_section_header(doc, 'MONTHLY RECURRING COSTS')
@@ -492,7 +391,7 @@ def main():
         'to help you track and optimize these costs.',
         italic=True)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== POST-LAUNCH SUPPORT ====================
     add_section_header(doc, 'POST-LAUNCH SUPPORT PACKAGES')
@@ -514,11 +413,7 @@ def main():
 
     add_subsection_header(doc, 'Option A: Essential Support')
 
-    p = doc.add_paragraph()
-    run = p.add_run('Monthly Fee: RM 11,000/month')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = ACCENT_COLOR
+    add_paragraph_text(doc, 'Monthly Fee: RM 11,000/month', bold=True, color=ACCENT_COLOR)
 
     doc.add_paragraph()
 
@@ -539,11 +434,7 @@ def main():
 
     add_subsection_header(doc, 'Option B: Growth Support')
 
-    p = doc.add_paragraph()
-    run = p.add_run('Monthly Fee: RM 20,000/month')
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = ACCENT_COLOR
+    add_paragraph_text(doc, 'Monthly Fee: RM 20,000/month', bold=True, color=ACCENT_COLOR)
 
     doc.add_paragraph()
 
@@ -563,13 +454,9 @@ def main():
 
     doc.add_paragraph()
 
-    p = doc.add_paragraph()
-    run = p.add_run('*Recommended: Growth package for active development and tournament event support.')
-    run.font.size = Pt(11)
-    run.font.italic = True
-    run.font.color.rgb = PRIMARY_COLOR
+    add_paragraph_text(doc, '*Recommended: Growth package for active development and tournament event support.', italic=True, color=PRIMARY_COLOR)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== TERMS & CONDITIONS ====================
     add_section_header(doc, 'TERMS & CONDITIONS')
@@ -588,19 +475,12 @@ def main():
     ]
 
     for title, desc in terms:
-        p = doc.add_paragraph()
-        run = p.add_run(title)
-        run.font.size = Pt(11)
-        run.font.bold = True
-        run.font.color.rgb = PRIMARY_COLOR
+        add_paragraph_text(doc, title, bold=True, color=PRIMARY_COLOR)
 
-        p = doc.add_paragraph()
-        run = p.add_run(desc)
-        run.font.size = Pt(11)
-        run.font.color.rgb = TEXT_COLOR
+        p = add_paragraph_text(doc, desc)
         p.paragraph_format.space_after = Pt(8)
 
-    doc.add_page_break()
+    add_page_break(doc)
 
     # ==================== CLOSING ====================
     doc.add_paragraph()
@@ -632,10 +512,43 @@ def main():
     run.font.bold = True
     run.font.color.rgb = ACCENT_COLOR
 
-    # Save document
-    output_path = '/Users/clifflai/development/vsc-workspace/poker-dream/Poker_Dream_Website_Proposal.docx'
-    doc.save(output_path)
-    print(f'Document saved to: {output_path}')
+    return doc
+
+def create_website_proposal(output=OUTPUT_PATH, render_cache=None, reproducible=None, pdf=None):
+    """Build the website proposal and save it to a path or file-like object
+
+    With output=None the .docx bytes are returned instead. With render_cache,
+    an unchanged proposal is served from that directory without rebuilding
+    (cached documents are always saved reproducibly). pdf exports the same
+    document as PDF; it defaults to on when output is a path ending in .pdf.
+    """
+    if pdf is None:
+        pdf = is_pdf(output)
+    if render_cache and pdf:
+        data, _ = cached_render(render_cache, 'website.pdf', {}, lambda: render_pdf(build_document()))
+        result = save_bytes(data, output)
+    elif render_cache:
+        data, _ = cached_render(render_cache, 'website', {},
+                                lambda: save_document(build_document(), reproducible=True))
+        result = save_bytes(data, output)
+    elif pdf:
+        result = save_pdf(build_document(), output)
+    else:
+        result = save_document(build_document(), output, reproducible=reproducible)
+    if is_path(output):
+        print(f'Document saved to: {output}')
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the Poker Dream website proposal')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help='Output .docx or .pdf path, or - for stdout')
+    parser.add_argument('--render-cache', help='Reuse whole documents rendered from the same inputs in this directory')
+    parser.add_argument('--reproducible', action='store_true', default=None,
+                        help='Pin timestamps so identical content gives identical bytes (default: on if SOURCE_DATE_EPOCH is set)')
+    parser.add_argument('--pdf', action='store_true', default=None,
+                        help='Export PDF instead of .docx (default: on if the output path ends in .pdf)')
+    args = parser.parse_args()
+    create_website_proposal(args.output, args.render_cache, args.reproducible, args.pdf)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Declarative slide deck engine
+Renders decks described as data (JSON, or YAML when PyYAML is installed)
+with the create_pptx helpers. Each slide names a layout (title, columns,
+pillars, flywheel, metrics, phases, comparison, freeform) and supplies its
+content; positions come from deck_layout, which computes them once per
+layout shape and slide size instead of per slide. Positions in freeform
+slides are in inches; freeform images are fitted inside their box by
+image_assets.
+
+    python deck_engine.py decks/ecosystem.json -o deck.pptx
+    python deck_engine.py region_*.json --output-dir decks_out --workers 8
+
+Decks with many slides are built in chunks across worker processes and
+merged into one package in slide order (see build_deck).
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+
+from lxml import etree
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.util import Inches
+
+from create_pptx import (COLORS, add_body_text, add_bullet_points, add_title_text,
+                         new_presentation, set_slide_background)
+from deck_layout import geometry, header_geometry
+from image_assets import DEFAULT_DPI, add_slide_image, resolve, source_digest
+from poker_dream_docs.doc_output import is_path, save_document
+from poker_dream_docs.package_zip import DEFAULT_LEVEL, format_report
+from pptx_text import add_rounded_rectangle, add_table, paragraph_xml
+
+DECKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'decks')
+DEFAULT_SPEC = os.path.join(DECKS_DIR, 'ecosystem.json')
+
+ALIGN = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
+
+HIGHLIGHT_FILL = 'FFF8E7'
+RULE_COLOR = RGBColor(0xDD, 0xDD, 0xDD)
+
+# Below this many slides per worker, process startup costs more than it saves
+MIN_SLIDES_PER_WORKER = 20
+
+# Attributes that hold relationship ids in slide XML
+REL_ATTRS = (qn('r:embed'), qn('r:link'), qn('r:id'))
+
+def load_spec(path):
+    """Load a deck spec from a .json, .yaml or .yml file"""
+    with open(path, encoding='utf-8') as f:
+        if path.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit(f'PyYAML is required to read {path} (pip install pyyaml)')
+            return yaml.safe_load(f)
+        return json.load(f)
+
+def color(value, default='dark_gray'):
+    """Resolve a COLORS name or RRGGBB hex string"""
+    value = value or default
+    if isinstance(value, RGBColor):
+        return value
+    return COLORS[value] if value in COLORS else RGBColor.from_string(value.lstrip('#'))
+
+def box(*inches):
+    """Convert (left, top, width, height) in inches to EMU"""
+    return tuple(Inches(value) for value in inches)
+
+# -- Renderers --
+
+def render_header(slide, spec):
+    """Slide title and optional subtitle shared by the content layouts"""
+    prs = slide.part.package.presentation_part.presentation
+    title_box, subtitle_box = header_geometry(spec.get('title_top', 0.3), spec.get('subtitle_top', 1.0),
+                                              prs.slide_width, prs.slide_height)
+    if spec.get('title'):
+        add_title_text(slide, spec['title'], *title_box,
+                       font_size=spec.get('title_size', 36), align=ALIGN[spec.get('title_align', 'left')])
+    if spec.get('subtitle'):
+        add_body_text(slide, spec['subtitle'], *subtitle_box, font_size=spec.get('subtitle_size', 16))
+
+def shifted(spot, offset):
+    """Move a (left, top, width, height) box down by offset EMU"""
+    left, top, width, height = spot
+    return left, top + offset, width, height
+
+def render_title(slide, spec, geo):
+    text_color = color(spec.get('color'), 'black')
+    prs = slide.part.package.presentation_part.presentation
+    title_box, _ = header_geometry(spec.get('title_top', 1.5), 0, prs.slide_width, prs.slide_height)
+    top = title_box[1]
+    add_title_text(slide, spec['title'], *shifted(geo['title'], top), font_size=spec.get('title_size', 48),
+                   color=text_color, align=PP_ALIGN.CENTER)
+    if spec.get('subtitle'):
+        add_body_text(slide, spec['subtitle'], *shifted(geo['subtitle'], top), font_size=spec.get('subtitle_size', 20),
+                      color=color(spec.get('color')), align=PP_ALIGN.CENTER)
+    if spec.get('footer'):
+        add_body_text(slide, spec['footer'], *geo['footer'], font_size=24, bold=True,
+                      color=text_color, align=PP_ALIGN.CENTER)
+
+def render_columns(slide, spec, geo):
+    render_header(slide, spec)
+    for column, spot in zip(spec['columns'], geo):
+        add_body_text(slide, column['heading'], *spot['heading'], font_size=spec.get('heading_size', 20),
+                      bold=True, color=color(column.get('color'), 'black'))
+        items_box = spot['items'] if column.get('quote') else spot['items_tall']
+        add_bullet_points(slide, column['items'], *items_box, font_size=13)
+        if column.get('quote'):
+            add_body_text(slide, column['quote'], *spot['quote'], font_size=12, color=COLORS['gold'])
+
+def render_pillars(slide, spec, geo):
+    render_header(slide, spec)
+    for pillar, spot in zip(spec['pillars'], geo):
+        accent = color(pillar.get('color'), 'gold')
+        add_body_text(slide, pillar['heading'], *spot['heading'], font_size=22, bold=True,
+                      color=accent, align=PP_ALIGN.CENTER)
+        if pillar.get('text'):
+            add_body_text(slide, pillar['text'], *spot['text'], font_size=14, align=PP_ALIGN.CENTER)
+        add_rounded_rectangle(slide, *spot['panel'], color(pillar.get('fill'), 'white'), accent)
+        if pillar.get('lead'):
+            add_body_text(slide, pillar['lead'], *spot['lead'], font_size=13, bold=True)
+        if pillar.get('items'):
+            add_bullet_points(slide, pillar['items'], *spot['items'], font_size=12)
+        if pillar.get('footer'):
+            add_body_text(slide, pillar['footer'], *spot['footer'], font_size=14, bold=True,
+                          align=PP_ALIGN.CENTER)
+
+def render_flywheel(slide, spec, geo):
+    render_header(slide, spec)
+    for step, spot in zip(spec['steps'], geo):
+        add_body_text(slide, step['heading'], *spot['heading'], font_size=16, bold=True,
+                      color=color(step.get('color'), 'gold'))
+        add_body_text(slide, step['text'], *spot['text'], font_size=12)
+
+def render_metrics(slide, spec, geo):
+    render_header(slide, spec)
+    for group, spot in zip(spec['groups'], geo):
+        add_body_text(slide, group['heading'], *spot['heading'], font_size=20, bold=True)
+        for (label, value), (label_box, value_box) in zip(group['rows'], spot['rows']):
+            add_body_text(slide, label + ':', *label_box, font_size=14)
+            add_body_text(slide, value, *value_box, font_size=14, bold=True, color=COLORS['green'])
+
+def render_phases(slide, spec, geo):
+    render_header(slide, spec)
+    for phase, spot in zip(spec['phases'], geo):
+        accent = color(phase.get('color'), 'gold')
+        add_rounded_rectangle(slide, *spot['panel'], COLORS['white'], accent)
+        add_body_text(slide, phase['title'], *spot['title'], font_size=16, bold=True)
+        add_body_text(slide, phase['timeline'], *spot['timeline'], font_size=12, color=accent)
+        add_body_text(slide, phase['focus'], *spot['focus'], font_size=11, bold=True)
+        add_body_text(slide, phase['deliverables'], *spot['deliverables'], font_size=11)
+        add_body_text(slide, phase['goal'], *spot['goal'], font_size=11, bold=True)
+
+def render_comparison(slide, spec, geo):
+    """Headers and rows as one a:tbl rather than a text box per cell"""
+    render_header(slide, spec)
+    highlight = spec.get('highlight_column')
+    header = [paragraph_xml(text, 14, COLORS['dark_gray'], bold=True) for text in spec['headers']]
+    rows = [(geo['header_height'], COLORS['gold'], header)]
+    for row in spec['rows']:
+        cells = [paragraph_xml(text, 13, COLORS['green'] if j == highlight else COLORS['dark_gray'])
+                 for j, text in enumerate(row)]
+        rows.append((geo['row_height'], RULE_COLOR, cells))
+    left, top, _ = geo['table']
+    add_table(slide, left, top, geo['col_widths'], rows)
+    if spec.get('note'):
+        add_rounded_rectangle(slide, *geo['note_panel'], color(HIGHLIGHT_FILL), COLORS['green'])
+        add_body_text(slide, spec['note'], *geo['note'], font_size=16, bold=True)
+
+def render_freeform(slide, spec, geo):
+    """Place elements at explicit positions (inches)"""
+    render_header(slide, spec)
+    for element in spec['elements']:
+        at = box(*element['at'])
+        kind = element.get('kind', 'text')
+        if kind == 'image':
+            add_slide_image(slide, element['path'], *at, dpi=element.get('dpi', DEFAULT_DPI),
+                            crop=element.get('crop'), fmt=element.get('format', 'png'))
+        elif kind == 'box':
+            add_rounded_rectangle(slide, *at, color(element.get('fill'), 'white'), color(element.get('line'), 'gold'))
+        elif kind == 'bullets':
+            add_bullet_points(slide, element['items'], *at, font_size=element.get('size', 14),
+                              color=color(element.get('color')))
+        else:
+            add_body_text(slide, element['text'], *at, font_size=element.get('size', 18),
+                          bold=element.get('bold', False), color=color(element.get('color')),
+                          align=ALIGN[element.get('align', 'left')])
+
+# Layout name -> (spec key whose length sizes the geometry, renderer)
+LAYOUTS = {
+    'title': (None, render_title),
+    'columns': ('columns', render_columns),
+    'pillars': ('pillars', render_pillars),
+    'flywheel': ('steps', render_flywheel),
+    'metrics': ('groups', render_metrics),
+    'phases': ('phases', render_phases),
+    'comparison': ('headers', render_comparison),
+    'freeform': (None, render_freeform),
+}
+
+def row_count(layout, spec):
+    """Rows per item for layouts whose geometry depends on it"""
+    if layout == 'comparison':
+        return len(spec['rows'])
+    if layout == 'metrics':
+        return max(len(group['rows']) for group in spec['groups'])
+    return 0
+
+def render_slide(prs, spec):
+    """Add one slide described by spec to prs"""
+    layout = spec.get('layout', 'freeform')
+    if layout not in LAYOUTS:
+        raise ValueError(f'Unknown slide layout: {layout}')
+    items_key, render = LAYOUTS[layout]
+
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    set_slide_background(slide, color(spec.get('background'), 'light_gray'))
+    geo = None
+    if layout != 'freeform':
+        count = len(spec[items_key]) if items_key else 0
+        geo = geometry(layout, count, row_count(layout, spec), bool(spec.get('subtitle')),
+                       prs.slide_width, prs.slide_height)
+    render(slide, spec, geo)
+    return slide
+
+def build_slide_parts(slide_specs):
+    """Render slides in a scratch presentation; return each slide's XML and relationships
+
+    Relationships are (rId, 'image', image bytes) or (rId, 'external',
+    reltype, target) so they can be recreated in another package.
+    """
+    prs = new_presentation()
+    parts = []
+    for slide_spec in slide_specs:
+        slide = render_slide(prs, slide_spec)
+        related = []
+        for rId, rel in slide.part.rels.items():
+            if rel.is_external:
+                related.append((rId, 'external', rel.reltype, rel.target_ref))
+            elif rel.reltype == RT.IMAGE:
+                related.append((rId, 'image', rel.target_part.blob))
+        parts.append((etree.tostring(slide._element), related))
+    return parts
+
+def merge_slide_parts(prs, parts):
+    """Append slides built by build_slide_parts to prs, in order"""
+    layout = prs.slide_layouts[6]
+    for xml, related in parts:
+        slide = prs.slides.add_slide(layout)
+        rIds = {}
+        for rId, kind, *target in related:
+            if kind == 'image':
+                # Identical images share one media part across the whole deck
+                _, rIds[rId] = slide.part.get_or_add_image_part(io.BytesIO(target[0]))
+            else:
+                rIds[rId] = slide.part.relate_to(target[1], target[0], is_external=True)
+
+        built = parse_xml(xml)
+        if rIds:
+            for node in built.iter():
+                for attr in REL_ATTRS:
+                    if node.get(attr) in rIds:
+                        node.set(attr, rIds[node.get(attr)])
+        # Swap contents in place so the Slide object already bound to this element stays valid
+        element = slide._element
+        element[:] = list(built)
+        for name, value in built.attrib.items():
+            element.set(name, value)
+
+def build_deck(spec, workers=1):
+    """Render a deck spec (dict with a 'slides' list) into a new Presentation
+
+    With workers > 1, large decks are rendered in chunks across worker
+    processes and merged back in slide order. Each worker gets at least
+    MIN_SLIDES_PER_WORKER slides, so smaller decks use fewer workers and
+    decks under twice that are built in this process.
+    """
+    slide_specs = spec['slides']
+    prs = new_presentation()
+    workers = min(workers or 1, len(slide_specs) // MIN_SLIDES_PER_WORKER)
+    if workers <= 1:
+        for slide_spec in slide_specs:
+            render_slide(prs, slide_spec)
+        return prs
+
+    # Only parallel builds pay for importing the process pool machinery
+    from concurrent.futures import ProcessPoolExecutor
+    size = math.ceil(len(slide_specs) / workers)
+    chunks = [slide_specs[i:i + size] for i in range(0, len(slide_specs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for parts in executor.map(build_slide_parts, chunks):
+            merge_slide_parts(prs, parts)
+    return prs
+
+def spec_assets(spec):
+    """Return {path: sha256} for every image file a deck spec places"""
+    return {element['path']: source_digest(resolve(element['path']))[0]
+            for slide_spec in spec['slides'] for element in slide_spec.get('elements', ())
+            if element.get('kind') == 'image'}
+
+def render_deck(spec_path, output=None, workers=1, reproducible=None):
+    """Render the spec at spec_path to output (path, stream, or None for bytes)"""
+    return save_document(build_deck(load_spec(spec_path), workers), output, reproducible=reproducible)
+
+def main():
+    parser = argparse.ArgumentParser(description='Render slide decks from declarative specs')
+    parser.add_argument('specs', nargs='*', default=[DEFAULT_SPEC], help='Deck spec files (.json, .yaml)')
+    parser.add_argument('-o', '--output', help='Output .pptx path (single spec only)')
+    parser.add_argument('--output-dir', default='.', help='Directory for decks named after their specs')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Worker processes for building slides of large decks')
+    parser.add_argument('--level', type=int, default=DEFAULT_LEVEL, help='Deflate level (0-9) for XML parts')
+    parser.add_argument('--report', action='store_true', help='Print per-part package sizes')
+    parser.add_argument('--reproducible', action='store_true', default=None,
+                        help='Pin timestamps so identical content gives identical bytes (default: on if SOURCE_DATE_EPOCH is set)')
+    args = parser.parse_args()
+
+    if args.output and len(args.specs) > 1:
+        parser.error('-o/--output takes a single spec; use --output-dir for several')
+    for spec_path in args.specs:
+        spec = load_spec(spec_path)
+        output = args.output or os.path.join(
+            args.output_dir, spec.get('output') or os.path.splitext(os.path.basename(spec_path))[0] + '.pptx')
+        report = []
+        save_document(build_deck(spec, args.workers), output, args.level, report, args.reproducible)
+        if is_path(output):
+            print(f'Deck saved to: {output}')
+        if args.report:
+            print(format_report(report))
+
+if __name__ == '__main__':
+    main()
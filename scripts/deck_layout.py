@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Slide layout geometry for the deck engine
+Computes the text box, panel and table positions for each deck_engine layout.
+Results are memoized per (layout, items, rows, header shape, slide size) with
+LRU eviction, so a deck of many slides sharing a layout computes its grid once.
+Positions are designed on a 13.333 x 7.5 in slide and scaled to the actual
+slide size.
+"""
+
+from functools import lru_cache
+import math
+
+from pptx.util import Emu, Inches
+
+REFERENCE_WIDTH = Inches(13.333)
+REFERENCE_HEIGHT = Inches(7.5)
+
+def frame(slide_width, slide_height):
+    """Return box(left, top, width, height): reference inches -> scaled EMU"""
+    sx = slide_width / REFERENCE_WIDTH
+    sy = slide_height / REFERENCE_HEIGHT
+
+    def box(left, top, width, height):
+        return (Emu(round(Inches(left) * sx)), Emu(round(Inches(top) * sy)),
+                Emu(round(Inches(width) * sx)), Emu(round(Inches(height) * sy)))
+    return box
+
+def title_geometry(box, count, rows, subtitle):
+    # Tops are relative to the slide's title_top
+    return {
+        'title': box(0.8, 0, 11.7, 2),
+        'subtitle': box(1.5, 2, 10.3, 1.5),
+        'footer': box(5.5, 6.5, 2.5, 0.5),
+    }
+
+def columns_geometry(box, count, rows, subtitle):
+    pitch = 12.3 / count
+    top = 2.3 if subtitle else 1.5
+    return [{
+        'heading': box(0.5 + i * pitch, top, pitch - 0.3, 0.6),
+        'items': box(0.5 + i * pitch, top + 0.7, pitch - 0.3, 2.5),
+        'items_tall': box(0.5 + i * pitch, top + 0.7, pitch - 0.3, 4.5),
+        'quote': box(0.5 + i * pitch, 5.5, pitch - 0.3, 1),
+    } for i in range(count)]
+
+def pillars_geometry(box, count, rows, subtitle):
+    pitch = 13 / count
+    return [{
+        'heading': box(0.5 + i * pitch, 1.2, pitch - 1, 0.8),
+        'text': box(0.5 + i * pitch, 2.1, pitch - 1, 0.8),
+        'panel': box(0.8 + i * pitch, 3, pitch - 1.5, 2.2),
+        'lead': box(1 + i * pitch, 3.15, pitch - 1.9, 0.4),
+        'items': box(1 + i * pitch, 3.5, pitch - 1.9, 1.8),
+        'footer': box(0.5 + i * pitch, 5.5, pitch - 1, 0.4),
+    } for i in range(count)]
+
+def flywheel_geometry(box, count, rows, subtitle):
+    # Clockwise from top right: down the right column, then up the left one
+    right = math.ceil(count / 2)
+    spots = [(8, 1.2 + row * 2.6) for row in range(right)]
+    spots += [(0.5, 1.2 + row * 2.6) for row in reversed(range(count - right))]
+    return [{
+        'heading': box(left, top, 4.5, 0.4),
+        'text': box(left, top + 0.4, 4.5, 2),
+    } for left, top in spots]
+
+def metrics_geometry(box, count, rows, subtitle):
+    top = 1.8 if subtitle else 1.3
+    groups = []
+    for i in range(count):
+        left = 0.5 + (i % 2) * 6.3
+        group_top = top + (i // 2) * 2.5
+        groups.append({
+            'heading': box(left, group_top, 5.8, 0.5),
+            'rows': [(box(left, group_top + 0.5 + j * 0.4, 3.5, 0.4),
+                      box(left + 3.5, group_top + 0.5 + j * 0.4, 2, 0.4)) for j in range(rows)],
+        })
+    return groups
+
+def phases_geometry(box, count, rows, subtitle):
+    pitch = 12.8 / count
+    width = pitch - 0.2
+    inner = width - 0.3
+    return [{
+        'panel': box(0.3 + i * pitch, 1.3, width, 5.5),
+        'title': box(0.45 + i * pitch, 1.45, inner, 0.4),
+        'timeline': box(0.45 + i * pitch, 1.9, inner, 0.3),
+        'focus': box(0.45 + i * pitch, 2.4, inner, 0.6),
+        'deliverables': box(0.45 + i * pitch, 3.1, inner, 1.5),
+        'goal': box(0.45 + i * pitch, 5, inner, 1.2),
+    } for i in range(count)]
+
+def comparison_geometry(box, count, rows, subtitle):
+    # The label column gets two thirds of a value column's width
+    unit = 12 / (count * 3 - 1)
+    widths = [box(0, 0, unit * (2 if j == 0 else 3), 0)[2] for j in range(count)]
+    # Rows share the space above the note, at most 0.6 in each
+    row_height = min(0.6, 3.2 / max(rows, 1))
+    left, top, width, _ = box(0.5, 2, 12, 0)
+    return {
+        'table': (left, top, width),
+        'col_widths': widths,
+        'header_height': box(0, 0, 0, 0.4)[3],
+        'row_height': box(0, 0, 0, row_height)[3],
+        'note_panel': box(0.5, 5.8, 12, 1),
+        'note': box(0.7, 6, 11.6, 0.7),
+    }
+
+GEOMETRY = {
+    'title': title_geometry,
+    'columns': columns_geometry,
+    'pillars': pillars_geometry,
+    'flywheel': flywheel_geometry,
+    'metrics': metrics_geometry,
+    'phases': phases_geometry,
+    'comparison': comparison_geometry,
+}
+
+@lru_cache(maxsize=256)
+def geometry(layout, count, rows, subtitle, slide_width, slide_height):
+    """Return the shared geometry for a layout on a slide of the given size
+
+    count is the number of columns/cards/steps and rows the number of rows
+    in each (0 where a layout has none). Treat the result as read-only; it
+    is shared by every slide with the same key.
+    """
+    return GEOMETRY[layout](frame(slide_width, slide_height), count, rows, subtitle)
+
+@lru_cache(maxsize=64)
+def header_geometry(title_top, subtitle_top, slide_width, slide_height):
+    """Return the (title, subtitle) boxes of a content slide header"""
+    box = frame(slide_width, slide_height)
+    return box(0.5, title_top, 12, 0.8), box(0.5, subtitle_top, 12, 0.8)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Command line front end for the Poker Dream document generators
+Only the standard library is imported up front: listing templates and
+validating a manifest never load python-docx or python-pptx, and a build
+imports just the one builder it runs. startup-report shows where the import
+time of each entry point goes (python -X importtime).
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DECKS_DIR = os.path.join(SCRIPTS_DIR, 'decks')
+
+ENTRY_POINTS = ('create_pptx', 'deck_engine', 'create_proposal_docx', 'create_website_proposal_docx', 'md_to_docx')
+
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+def list_templates(args):
+    """Print the builders and deck specs that can be rendered"""
+    from render_all import BUILDERS
+    print('Builders:')
+    for name, output in BUILDERS.items():
+        print(f'  {name:<10} -> {output}')
+    print('Deck specs:')
+    for name in sorted(os.listdir(DECKS_DIR)):
+        if name.endswith(('.json', '.yaml', '.yml')):
+            print(f'  {os.path.join(DECKS_DIR, name)}')
+    return 0
+
+def validate_manifest(args):
+    """Check a client manifest without building anything"""
+    from poker_dream_docs.manifest import load_manifest, validate_manifest
+    try:
+        clients = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f'{args.manifest}: {e}')
+        return 1
+    errors = validate_manifest(clients)
+    for error in errors:
+        print(f'{args.manifest}: {error}')
+    print(f'{args.manifest}: {len(clients)} clients, {len(errors)} problems')
+    return 1 if errors else 0
+
+def build(args):
+    """Run one builder, importing only that builder's module"""
+    from render_all import BUILDERS, run_job
+    output_path = args.output or BUILDERS[args.builder]
+    result = run_job({'name': args.builder, 'builder': args.builder, 'output_path': output_path})
+    print(f"{result['output_path']} ({result['seconds']:.3f}s)")
+    return 0
+
+def import_times(module):
+    """Return (self us, cumulative us, depth, name) per import of module in a fresh interpreter"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f'import {module} failed:\n{proc.stderr.strip()}')
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(self_us), int(cumulative_us), (len(indent) - 1) // 2, name))
+    return rows
+
+def startup_report(args):
+    """Print the import cost of each entry point and its slowest top-level dependencies"""
+    for module in args.modules or ENTRY_POINTS:
+        start = time.perf_counter()
+        rows = import_times(module)
+        elapsed = time.perf_counter() - start
+        total = next(cumulative for _, cumulative, depth, name in rows if name == module and depth == 0)
+        print(f'{module}: {total / 1000:.1f} ms import, {elapsed * 1000:.0f} ms process, {len(rows)} modules')
+        # Direct imports of the entry point, by cumulative cost
+        direct = sorted((row for row in rows if row[2] == 1), key=lambda row: row[1], reverse=True)
+        for _, cumulative, _, name in direct[:args.top]:
+            print(f'  {cumulative / 1000:8.1f} ms  {name}')
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Poker Dream document generators')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list-templates', help='List builders and deck specs').set_defaults(run=list_templates)
+
+    command = commands.add_parser('validate-manifest', help='Check a CSV or JSONL client manifest')
+    command.add_argument('manifest', help='Manifest path')
+    command.set_defaults(run=validate_manifest)
+
+    command = commands.add_parser('build', help='Build one document')
+    command.add_argument('builder', choices=('pptx', 'proposal', 'website'), help='Builder to run')
+    command.add_argument('-o', '--output', help='Output path (default: the builder\'s file name)')
+    command.set_defaults(run=build)
+
+    command = commands.add_parser('startup-report', help='Show import time per entry point')
+    command.add_argument('modules', nargs='*', help=f'Modules to import (default: {", ".join(ENTRY_POINTS)})')
+    command.add_argument('--top', type=int, default=8, help='Dependencies to list per module')
+    command.set_defaults(run=startup_report)
+
+    args = parser.parse_args()
+    sys.exit(args.run(args))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Stream text and table rows out of generated .docx and .pptx files
+Reads word/document.xml, or each slide in presentation order, straight from
+the ZIP with lxml iterparse and yields paragraphs and table rows as they
+close, clearing parsed elements as it goes; python-docx and python-pptx are
+never loaded. A directory of outputs is audited across worker processes.
+
+    python extract_text.py ../Poker_Dream_Website_Proposal.docx
+    python extract_text.py out/ --grep 'RM [0-9,]+|valid' --workers 8
+    python extract_text.py out/ --jsonl > audit.jsonl
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+import zipfile
+
+from lxml import etree
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+P_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# Namespace -> {text element: None to take its text, or the string it stands for}
+TEXT_TAGS = {
+    W_NS: {f'{{{W_NS}}}t': None, f'{{{W_NS}}}tab': '\t', f'{{{W_NS}}}br': '\n', f'{{{W_NS}}}cr': '\n'},
+    A_NS: {f'{{{A_NS}}}t': None, f'{{{A_NS}}}br': '\n'},
+}
+
+EXTENSIONS = ('.docx', '.pptx')
+
+def paragraph_text(p, text_tags):
+    """Return the text of a paragraph element, with tabs and line breaks"""
+    parts = []
+    for node in p.iter(*text_tags):
+        value = text_tags[node.tag]
+        parts.append(node.text or '' if value is None else value)
+    return ''.join(parts)
+
+def iter_blocks(stream, ns):
+    """Yield ('paragraph', text) and ('row', [cell text]) from a WordprocessingML or DrawingML stream
+
+    Paragraphs inside table cells are folded into their cell; nested tables
+    are folded into the enclosing cell as ' | '-joined rows.
+    """
+    p_tag, tbl_tag, tr_tag, tc_tag = (f'{{{ns}}}{name}' for name in ('p', 'tbl', 'tr', 'tc'))
+    text_tags = TEXT_TAGS[ns]
+    depth = 0
+    rows = []
+    cells = []
+    for event, elem in etree.iterparse(stream, events=('start', 'end'), tag=(p_tag, tbl_tag, tr_tag, tc_tag)):
+        tag = elem.tag
+        if event == 'start':
+            if tag == tbl_tag:
+                depth += 1
+            elif tag == tr_tag:
+                rows.append([])
+            elif tag == tc_tag:
+                cells.append([])
+            continue
+
+        if tag == p_tag:
+            text = paragraph_text(elem, text_tags)
+            if depth:
+                cells[-1].append(text)
+            elif text.strip():
+                yield 'paragraph', text
+        elif tag == tc_tag:
+            rows[-1].append('\n'.join(cells.pop()))
+        elif tag == tr_tag:
+            row = rows.pop()
+            if depth == 1:
+                yield 'row', row
+            else:
+                cells[-1].append(' | '.join(row))
+        else:
+            depth -= 1
+            continue
+
+        # Everything up to a closed paragraph, cell or row has been read; drop it
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+def slide_names(zf):
+    """Return the slide part names of a presentation in slide order"""
+    rels = etree.fromstring(zf.read('ppt/_rels/presentation.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{{{PKG_REL_NS}}}Relationship')}
+    presentation = etree.fromstring(zf.read('ppt/presentation.xml'))
+    return [posixpath.normpath(posixpath.join('ppt', targets[slide_id.get(f'{{{R_NS}}}id')]))
+            for slide_id in presentation.iter(f'{{{P_NS}}}sldId')]
+
+def iter_text(path):
+    """Yield (slide number or None, kind, value) for every paragraph and table row in a .docx or .pptx"""
+    with zipfile.ZipFile(path) as zf:
+        if path.lower().endswith('.pptx'):
+            for number, name in enumerate(slide_names(zf), 1):
+                with zf.open(name) as stream:
+                    for kind, value in iter_blocks(stream, A_NS):
+                        yield number, kind, value
+        else:
+            with zf.open('word/document.xml') as stream:
+                for kind, value in iter_blocks(stream, W_NS):
+                    yield None, kind, value
+
+def block_text(kind, value):
+    """Return a paragraph as is and a row as | cell | cell |"""
+    return value if kind == 'paragraph' else '| ' + ' | '.join(value) + ' |'
+
+def extract_file(path, pattern=None):
+    """Return [{'file', 'slide', 'kind', 'text'[, 'cells']}] for path, keeping only blocks matching pattern
+
+    A file that cannot be read ends its records with one of kind 'error'
+    whose text says why, so one bad file does not stop an audit.
+    """
+    matcher = re.compile(pattern) if pattern else None
+    records = []
+    try:
+        for slide, kind, value in iter_text(path):
+            text = block_text(kind, value)
+            if matcher and not matcher.search(text):
+                continue
+            record = {'file': path, 'slide': slide, 'kind': kind, 'text': text}
+            if kind == 'row':
+                record['cells'] = value
+            records.append(record)
+    except (OSError, KeyError, zipfile.BadZipFile, etree.LxmlError) as e:
+        records.append({'file': path, 'slide': None, 'kind': 'error', 'text': f'{type(e).__name__}: {e}'})
+    return records
+
+def find_files(paths):
+    """Expand directories into the .docx/.pptx files under them"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if name.lower().endswith(EXTENSIONS) and not name.startswith('~$'))
+        else:
+            files.append(path)
+    return files
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract text and table rows from .docx/.pptx files')
+    parser.add_argument('paths', nargs='+', help='Files or directories of generated documents')
+    parser.add_argument('--grep', help='Only print paragraphs and rows matching this regular expression')
+    parser.add_argument('--jsonl', action='store_true', help='Print one JSON record per paragraph or row')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes for many files')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    files = find_files(args.paths)
+    if args.workers > 1 and len(files) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        results = executor.map(extract_file, files, [args.grep] * len(files),
+                               chunksize=max(1, len(files) // (args.workers * 4)))
+    else:
+        executor = None
+        results = (extract_file(path, args.grep) for path in files)
+
+    count = 0
+    errors = 0
+    for records in results:
+        for record in records:
+            if record['kind'] == 'error':
+                print(f"{record['file']}: {record['text']}", file=sys.stderr)
+                errors += 1
+                continue
+            if args.jsonl:
+                print(json.dumps(record, ensure_ascii=False))
+            else:
+                where = record['file'] if record['slide'] is None else f"{record['file']}:slide {record['slide']}"
+                print(f"{where}: {record['text']}")
+            count += 1
+    if executor:
+        executor.shutdown()
+    print(f'{count} blocks from {len(files)} files in {time.perf_counter() - start:.2f}s'
+          + (f', {errors} unreadable' if errors else ''), file=sys.stderr)
+    if errors:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
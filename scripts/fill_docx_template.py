@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Fill {{placeholders}} in a finished Word document
+Opens a hand-polished .docx once, joins placeholders that Word has split
+across runs (the whole placeholder takes the formatting of the run it starts
+in) and precompiles word/document.xml into fixed chunks. Each variant then
+only joins the chunks with its escaped values, deflates the new
+word/document.xml and copies every other ZIP member through byte for byte,
+still compressed. Headers, footers and text boxes outside document.xml are
+left as they are.
+
+    python fill_docx_template.py ../Poker_Dream_Website_Proposal.docx --list
+    python fill_docx_template.py template.docx --set client_name="Acme" -o acme.docx
+    python fill_docx_template.py template.docx --manifest clients.csv --output-dir out
+"""
+
+from xml.sax.saxutils import escape
+import argparse
+import csv
+import json
+import os
+import re
+import time
+import zipfile
+
+from lxml import etree
+
+from poker_dream_docs.package_zip import DEFAULT_LEVEL, read_raw_members, write_raw_members
+
+DOCUMENT_PART = 'word/document.xml'
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_P = f'{{{W_NS}}}p'
+W_T = f'{{{W_NS}}}t'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+PLACEHOLDER = re.compile(r'\{\{\s*([A-Za-z_][\w.-]*)\s*\}\}')
+
+# Placeholder i is marked in the tree as <U+E000>i<U+E001> (private use characters)
+MARKER_START = '\ue000'
+MARKER_END = '\ue001'
+MARKER = re.compile(f'{MARKER_START}(\\d+){MARKER_END}'.encode('utf-8'))
+
+def _paragraph_texts(p):
+    """Return the w:t elements that belong to paragraph p itself (not nested text boxes)"""
+    return [t for t in p.iter(W_T) if next(t.iterancestors(W_P)) is p]
+
+def mark_placeholders(root):
+    """Replace every placeholder in the tree with a marker; return the placeholder names in marker order"""
+    names = []
+    for p in root.iter(W_P):
+        nodes = _paragraph_texts(p)
+        texts = [t.text or '' for t in nodes]
+        if '{' not in ''.join(texts):
+            continue
+        # Right to left, so the offsets of earlier matches stay valid
+        for match in reversed(list(PLACEHOLDER.finditer(''.join(texts)))):
+            ends = []
+            total = 0
+            for text in texts:
+                total += len(text)
+                ends.append(total)
+            first = next(i for i, end in enumerate(ends) if end > match.start())
+            last = next(i for i, end in enumerate(ends) if end >= match.end())
+            start_offset = match.start() - (ends[first] - len(texts[first]))
+            end_offset = match.end() - (ends[last] - len(texts[last]))
+
+            marker = f'{MARKER_START}{len(names)}{MARKER_END}'
+            names.append(match.group(1))
+            if first == last:
+                texts[first] = texts[first][:start_offset] + marker + texts[first][end_offset:]
+            else:
+                texts[first] = texts[first][:start_offset] + marker
+                for i in range(first + 1, last):
+                    texts[i] = ''
+                texts[last] = texts[last][end_offset:]
+            for i in range(first, last + 1):
+                nodes[i].text = texts[i]
+            nodes[first].set(XML_SPACE, 'preserve')
+    return names
+
+def compile_template(document_xml):
+    """Return (chunks, names): document_xml split around its placeholders"""
+    root = etree.fromstring(document_xml)
+    names = mark_placeholders(root)
+    xml = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+    parts = MARKER.split(xml)
+    # split() alternates text chunks with marker indexes
+    chunks = parts[0::2]
+    order = [names[int(index)] for index in parts[1::2]]
+    return chunks, order
+
+def load_template(path):
+    """Read a .docx template once: its raw ZIP members plus the compiled document.xml"""
+    with zipfile.ZipFile(path) as zf:
+        chunks, names = compile_template(zf.read(DOCUMENT_PART))
+    return {'members': read_raw_members(path), 'chunks': chunks, 'names': names}
+
+def _value_xml(value):
+    # Line breaks become w:br inside the placeholder's run
+    lines = escape(str(value)).split('\n')
+    return '</w:t><w:br/><w:t xml:space="preserve">'.join(lines).encode('utf-8')
+
+def render_document_xml(template, values):
+    """Return word/document.xml with values filled in; unknown placeholders are kept as typed"""
+    chunks, names = template['chunks'], template['names']
+    out = [chunks[0]]
+    for name, chunk in zip(names, chunks[1:]):
+        out.append(_value_xml(values[name]) if name in values else b'{{' + name.encode('utf-8') + b'}}')
+        out.append(chunk)
+    return b''.join(out)
+
+def fill(template, values, output, level=DEFAULT_LEVEL):
+    """Write the template filled with values to a path or stream; return the names left unfilled"""
+    write_raw_members(output, template['members'], {DOCUMENT_PART: render_document_xml(template, values)}, level)
+    return sorted(set(template['names']) - set(values))
+
+def load_rows(path):
+    """Load variant rows from a .csv or .jsonl file
+
+    Unlike the proposal manifest, values are kept exactly as given: an empty
+    cell fills its placeholder with nothing, and no column is decoded.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            # Short rows fill the missing cells with ''; extra cells are dropped
+            return [{key: value for key, value in row.items() if key is not None}
+                    for row in csv.DictReader(f, restval='')]
+        return [json.loads(line) for line in f if line.strip()]
+
+def variant_filename(template_path, values, index):
+    """Pick the output file name for one manifest row"""
+    if values.get('output'):
+        return values['output']
+    stem = os.path.splitext(os.path.basename(template_path))[0]
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', str(values.get('client_name', ''))).strip('_')
+    return f'{stem}_{slug or index + 1}.docx'
+
+def main():
+    parser = argparse.ArgumentParser(description='Fill {{placeholders}} in a .docx template without rebuilding it')
+    parser.add_argument('template', help='Word document containing {{placeholders}}')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE', help='Value for one placeholder')
+    parser.add_argument('--manifest', help='CSV or JSONL file with one variant per row')
+    parser.add_argument('-o', '--output', help='Output path for a single variant')
+    parser.add_argument('--output-dir', default='.', help='Directory for manifest variants')
+    parser.add_argument('--list', action='store_true', help='Print the placeholders in the template and exit')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    template = load_template(args.template)
+    if args.list:
+        for name in sorted(set(template['names'])):
+            print(f"{name} ({template['names'].count(name)}x)")
+        return
+
+    fixed = dict(item.split('=', 1) for item in args.set)
+    if not args.manifest:
+        output = args.output or variant_filename(args.template, fixed, 0)
+        missing = fill(template, fixed, output)
+        print(f'{output} ({time.perf_counter() - start:.3f}s)')
+        if missing:
+            print(f"Unfilled placeholders: {', '.join(missing)}")
+        return
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    missing = set()
+    rows = load_rows(args.manifest)
+    for index, row in enumerate(rows):
+        values = {**fixed, **row}
+        missing.update(fill(template, values, os.path.join(args.output_dir, variant_filename(args.template, values, index))))
+    print(f'{len(rows)} documents saved to: {args.output_dir} ({time.perf_counter() - start:.3f}s)')
+    if missing:
+        print(f"Unfilled placeholders: {', '.join(sorted(missing))}")
+
+if __name__ == '__main__':
+    main()
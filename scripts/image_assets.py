@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Image asset pipeline for decks and documents
+Crops and downsamples source images (screenshots/, pdf_pages/,
+pdf_pages_clean/) to the pixel size they are displayed at for a target DPI
+and re-encodes them once. Prepared images are memoized by source content
+hash, crop, size and format, so an image reused across slides or documents
+is processed once and produces identical bytes; python-pptx and python-docx
+then store each unique image once per package.
+"""
+
+from PIL import Image
+import hashlib
+import io
+import math
+import os
+
+from pptx.util import Emu, Inches
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+_sources = {}
+_prepared = {}
+
+def resolve(path):
+    """Resolve an asset path; relative paths are taken from the repo root"""
+    return path if os.path.isabs(path) else os.path.join(REPO_ROOT, path)
+
+def source_digest(path):
+    """Return (sha256 of the file, pixel size), cached per path, size and mtime"""
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _sources:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with Image.open(path) as image:
+            _sources[key] = digest, image.size
+    return _sources[key]
+
+def crop_box(size, crop):
+    """Pixel box for crop, given as (left, top, right, bottom) fractions"""
+    width, height = size
+    left, top, right, bottom = crop or (0, 0, 1, 1)
+    return round(left * width), round(top * height), round(right * width), round(bottom * height)
+
+def fit(size, crop, width, height):
+    """Return the (width, height) EMU that fit the cropped image inside a box, keeping its aspect"""
+    left, top, right, bottom = crop_box(size, crop)
+    aspect = (right - left) / (bottom - top)
+    if height is None or width / height < aspect:
+        return width, Emu(round(width / aspect))
+    return Emu(round(height * aspect)), height
+
+def prepare(path, width, height, dpi=DEFAULT_DPI, crop=None, fmt='png'):
+    """Return encoded image bytes for displaying path at width x height EMU
+
+    The image is cropped, then shrunk (never enlarged) to dpi pixels per
+    inch. fmt is 'png', or 'jpeg' for photographic images without
+    transparency.
+    """
+    path = resolve(path)
+    digest, size = source_digest(path)
+    target = (math.ceil(Emu(width).inches * dpi), math.ceil(Emu(height).inches * dpi))
+    key = (digest, tuple(crop or ()), target, fmt)
+    if key in _prepared:
+        return _prepared[key]
+
+    with Image.open(path) as image:
+        image = image.crop(crop_box(size, crop)) if crop else image.copy()
+    if image.width > target[0] or image.height > target[1]:
+        image.thumbnail(target, Image.LANCZOS)
+    if image.mode in ('RGBA', 'LA') and image.getchannel('A').getextrema()[0] == 255:
+        # Fully opaque: drop the unused alpha channel
+        image = image.convert('RGB')
+
+    out = io.BytesIO()
+    if fmt == 'jpeg':
+        image.convert('RGB').save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+    else:
+        image.save(out, 'PNG')
+    _prepared[key] = out.getvalue()
+    return _prepared[key]
+
+def add_slide_image(slide, path, left, top, width, height=None, dpi=DEFAULT_DPI, crop=None, fmt='png'):
+    """Add an image to slide, fitted and centered inside the box"""
+    _, size = source_digest(resolve(path))
+    fit_width, fit_height = fit(size, crop, width, height)
+    if height is not None:
+        left += (width - fit_width) // 2
+        top += (height - fit_height) // 2
+    data = prepare(path, fit_width, fit_height, dpi, crop, fmt)
+    return slide.shapes.add_picture(io.BytesIO(data), left, top, fit_width, fit_height)
+
+def add_document_image(doc, path, width=Inches(6), dpi=DEFAULT_DPI, crop=None, fmt='png'):
+    """Add an image paragraph to a python-docx document at the given width"""
+    _, size = source_digest(resolve(path))
+    fit_width, fit_height = fit(size, crop, width, None)
+    data = prepare(path, fit_width, fit_height, dpi, crop, fmt)
+    return doc.add_picture(io.BytesIO(data), width=fit_width)
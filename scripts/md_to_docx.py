@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Compile a Markdown proposal into a branded Word document
+Streams the source line by line into the docx builder: headings become the
+section header styles, pipe tables go through the styled table writer and
+bullets use the bullet style. Only the block being read (one paragraph, table
+or code fence) is held in memory.
+"""
+
+from docx.shared import Pt, Cm, Inches
+from poker_dream_docs.docx_helpers import (
+    add_section_header, add_subsection_header, add_h3_header, add_horizontal_line,
+)
+from poker_dream_docs.docx_styles import add_styled_paragraph, add_styled_run, ensure_styles
+from poker_dream_docs.docx_tables import create_styled_table
+from poker_dream_docs.docx_template_cache import base_document
+import argparse
+import os
+import re
+import time
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+BULLET = re.compile(r'^(\s*)[-*+]\s+(.*)$')
+NUMBERED = re.compile(r'^(\s*)(\d+)[.)]\s+(.*)$')
+RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+
+# **bold**, *italic* / _italic_, `code`, [text](link); underscores only
+# count at word boundaries, so snake_case names stay as typed
+INLINE = re.compile(r'\*\*(.+?)\*\*|(?<!\w)__(.+?)__(?!\w)|\*([^*\s][^*]*?)\*|(?<!\w)_([^_\s][^_]*?)_(?!\w)'
+                    r'|`([^`]+)`|\[([^\]]+)\]\([^)]*\)')
+
+def iter_blocks(lines):
+    """Yield (kind, value) blocks from an iterable of Markdown lines"""
+    paragraph = []
+    table = []
+    code = None
+
+    def flush():
+        if paragraph:
+            yield 'paragraph', ' '.join(paragraph)
+            paragraph.clear()
+        if table:
+            yield 'table', list(table)
+            table.clear()
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        if code is not None:
+            if line.lstrip().startswith('```'):
+                yield 'code', code
+                code = None
+            else:
+                code.append(line)
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith('|'):
+            if paragraph:
+                yield from flush()
+            if not TABLE_SEPARATOR.match(stripped):
+                table.append([cell.strip() for cell in stripped.strip('|').split('|')])
+            continue
+
+        yield from flush()
+
+        if not stripped:
+            continue
+        if stripped.startswith('```'):
+            code = []
+            continue
+
+        match = HEADING.match(line)
+        if match:
+            yield 'heading', (len(match.group(1)), match.group(2))
+            continue
+        if RULE.match(line):
+            yield 'rule', None
+            continue
+        match = BULLET.match(line)
+        if match:
+            yield 'bullet', (len(match.group(1).expandtabs(4)) // 2, match.group(2))
+            continue
+        match = NUMBERED.match(line)
+        if match:
+            yield 'numbered', (len(match.group(1).expandtabs(4)) // 2, f'{match.group(2)}. {match.group(3)}')
+            continue
+        if stripped.startswith('>'):
+            yield 'quote', stripped.lstrip('> ')
+            continue
+
+        paragraph.append(stripped)
+        # A hard line break (two trailing spaces) ends the paragraph
+        if line.endswith('  '):
+            yield from flush()
+
+    yield from flush()
+    if code is not None:
+        yield 'code', code
+
+def plain_text(text):
+    """Strip inline Markdown markup from text
+
+    >>> plain_text('avatar_url, cover_photo_url, _new_ and __all__ fields')
+    'avatar_url, cover_photo_url, new and all fields'
+    """
+    return INLINE.sub(lambda m: next(g for g in m.groups() if g is not None), text)
+
+def add_inline_runs(p, text, italic=False):
+    """Add runs for text, honouring **bold**, *italic*, `code` and links"""
+    pos = 0
+    for match in INLINE.finditer(text):
+        if match.start() > pos:
+            add_styled_run(p, text[pos:match.start()], italic=italic)
+        bold, bold_alt, em, em_alt, code, link = match.groups()
+        if bold or bold_alt:
+            add_styled_run(p, bold or bold_alt, bold=True, italic=italic)
+        elif em or em_alt:
+            add_styled_run(p, em or em_alt, italic=True)
+        elif code:
+            run = add_styled_run(p, code, italic=italic)
+            run.font.name = 'Consolas'
+        else:
+            add_styled_run(p, link, italic=italic)
+        pos = match.end()
+    if pos < len(text):
+        add_styled_run(p, text[pos:], italic=italic)
+    return p
+
+def build_base(doc):
+    """Set up brand styles and margins"""
+    ensure_styles(doc)
+    for section in doc.sections:
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        section.left_margin = Cm(2.5)
+        section.right_margin = Cm(2.5)
+
+def compile_markdown(lines, doc=None):
+    """Render Markdown lines into doc (a fresh branded document by default)"""
+    if doc is None:
+        doc, _ = base_document('markdown', build_base)
+
+    pending_rule = False
+    for kind, value in iter_blocks(lines):
+        # A --- rule right before a section header would double its gold line
+        if pending_rule and not (kind == 'heading' and value[0] <= 2):
+            add_horizontal_line(doc)
+        pending_rule = False
+
+        if kind == 'heading':
+            level, text = value
+            text = plain_text(text)
+            if level <= 2:
+                add_section_header(doc, text)
+            elif level == 3:
+                add_subsection_header(doc, text)
+            else:
+                add_h3_header(doc, text)
+        elif kind == 'table':
+            width = max(len(row) for row in value)
+            rows = [[plain_text(cell) for cell in row] + [''] * (width - len(row)) for row in value]
+            create_styled_table(doc, rows)
+        elif kind in ('bullet', 'numbered'):
+            depth, text = value
+            if kind == 'bullet':
+                text = ('• ' if depth == 0 else '– ') + text
+            p = add_inline_runs(add_styled_paragraph(doc, 'PDBullet'), text)
+            if depth:
+                p.paragraph_format.left_indent = Inches(0.25 * depth)
+        elif kind == 'paragraph':
+            add_inline_runs(add_styled_paragraph(doc, 'PDBody'), value)
+        elif kind == 'quote':
+            add_inline_runs(add_styled_paragraph(doc, 'PDBody'), value, italic=True)
+        elif kind == 'code':
+            for line in value:
+                run = add_styled_paragraph(doc, 'PDBody', line).runs[0]
+                run.font.name = 'Consolas'
+                run.font.size = Pt(9)
+        elif kind == 'rule':
+            pending_rule = True
+
+    if pending_rule:
+        add_horizontal_line(doc)
+    return doc
+
+def convert(source_path, output_path=None):
+    """Compile a Markdown file to .docx and return the output path"""
+    if output_path is None:
+        output_path = os.path.splitext(source_path)[0] + '.docx'
+    with open(source_path, encoding='utf-8') as f:
+        doc = compile_markdown(f)
+    doc.save(output_path)
+    return output_path
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile Markdown proposals into branded Word documents')
+    parser.add_argument('sources', nargs='+', help='Markdown files to convert')
+    parser.add_argument('--output-dir', help='Directory for .docx files (default: next to each source)')
+    args = parser.parse_args()
+
+    for source_path in args.sources:
+        output_path = None
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+            name = os.path.splitext(os.path.basename(source_path))[0] + '.docx'
+            output_path = os.path.join(args.output_dir, name)
+        start = time.perf_counter()
+        output_path = convert(source_path, output_path)
+        print(f'{source_path} -> {output_path} ({time.perf_counter() - start:.3f}s)')
+
+if __name__ == '__main__':
+    main()
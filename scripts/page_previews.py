@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Thumbnail and sprite sheet cache for page renders and screenshots
+Writes multi-size JPEG thumbnails of every image in pdf_pages/,
+pdf_pages_clean/ and screenshots/ into an on-disk cache, plus one sprite sheet
+per directory with the tile positions in its manifest. Thumbnails are named by
+source content hash; pages whose size and mtime are unchanged are not even
+re-read, and only new or changed pages are regenerated, in parallel.
+
+    <cache>/<directory>/manifest.json
+    <cache>/<directory>/<sha256[:16]>_<width>.jpg
+    <cache>/<directory>/sprite_<width>.jpg
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE_DIRS = ('pdf_pages', 'pdf_pages_clean', 'screenshots')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+DEFAULT_SIZES = (160, 320, 640)
+SPRITE_COLUMNS = 8
+JPEG_QUALITY = 80
+
+# Bump when thumbnail encoding changes so existing caches are rebuilt
+CACHE_VERSION = 1
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def make_thumbnails(source, out_dir, digest, sizes):
+    """Write one JPEG per width in sizes; return {width: file name}"""
+    names = {}
+    with Image.open(source) as image:
+        image = image.convert('RGB')
+        for width in sorted(sizes, reverse=True):
+            # Shrink from the previous (larger) thumbnail rather than the full page
+            if image.width > width:
+                image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            name = f'{digest[:16]}_{width}.jpg'
+            image.save(os.path.join(out_dir, name), 'JPEG', quality=JPEG_QUALITY, optimize=True)
+            names[str(width)] = name
+    return names
+
+def build_sprite(out_dir, entries, width):
+    """Tile every page's width-pixel thumbnail into one sheet; return its layout"""
+    tiles = [Image.open(os.path.join(out_dir, entry['thumbnails'][str(width)])) for entry in entries.values()]
+    if not tiles:
+        return None
+    tile_height = max(tile.height for tile in tiles)
+    columns = min(SPRITE_COLUMNS, len(tiles))
+    sheet = Image.new('RGB', (columns * width, math.ceil(len(tiles) / columns) * tile_height), 'white')
+    positions = {}
+    for index, (name, tile) in enumerate(zip(entries, tiles)):
+        x, y = (index % columns) * width, (index // columns) * tile_height
+        sheet.paste(tile, (x, y))
+        positions[name] = [x, y, tile.width, tile.height]
+        tile.close()
+    file_name = f'sprite_{width}.jpg'
+    sheet.save(os.path.join(out_dir, file_name), 'JPEG', quality=JPEG_QUALITY, optimize=True)
+    return {'file': file_name, 'width': width, 'tiles': positions}
+
+def load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == CACHE_VERSION else None
+
+def update_directory(source_dir, cache_dir, sizes=DEFAULT_SIZES, executor=None):
+    """Bring one directory's thumbnails and sprite up to date; return (generated, reused)
+
+    New and changed pages are thumbnailed on executor when given, otherwise
+    in this process.
+    """
+    out_dir = os.path.join(cache_dir, os.path.basename(os.path.normpath(source_dir)))
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    manifest = load_manifest(manifest_path)
+    if manifest is None or manifest.get('sizes') != list(sizes):
+        manifest = {'version': CACHE_VERSION, 'sizes': list(sizes), 'pages': {}, 'sprite': None}
+    old_pages = manifest['pages']
+
+    pages = {}
+    pending = {}
+    for name in sorted(os.listdir(source_dir)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        path = os.path.join(source_dir, name)
+        stat = os.stat(path)
+        entry = old_pages.get(name)
+        if entry and (entry['size'], entry['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+            pages[name] = entry
+            continue
+        digest = file_sha256(path)
+        entry = {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        old = old_pages.get(name)
+        if old and old['sha256'] == digest:
+            # Touched but not changed
+            pages[name] = dict(old, **entry)
+        else:
+            pages[name] = entry
+            pending[name] = path
+
+    if executor is None:
+        for name, path in pending.items():
+            pages[name]['thumbnails'] = make_thumbnails(path, out_dir, pages[name]['sha256'], sizes)
+    else:
+        futures = {name: executor.submit(make_thumbnails, path, out_dir, pages[name]['sha256'], sizes)
+                   for name, path in pending.items()}
+        for name, future in futures.items():
+            pages[name]['thumbnails'] = future.result()
+
+    if pending or set(pages) != set(old_pages) or not manifest.get('sprite'):
+        manifest['sprite'] = build_sprite(out_dir, pages, min(sizes))
+
+    # Drop thumbnails no page refers to any more
+    keep = {name for entry in pages.values() for name in entry['thumbnails'].values()}
+    for name in os.listdir(out_dir):
+        if name.endswith('.jpg') and not name.startswith('sprite_') and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+
+    manifest['pages'] = pages
+    tmp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return len(pending), len(pages) - len(pending)
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate cached page thumbnails and sprite sheets')
+    parser.add_argument('dirs', nargs='*', default=[os.path.join(REPO_ROOT, name) for name in SOURCE_DIRS],
+                        help='Image directories (default: pdf_pages, pdf_pages_clean, screenshots)')
+    parser.add_argument('--cache-dir', default=os.path.join(REPO_ROOT, '.preview_cache'),
+                        help='Where thumbnails, sprites and manifests are written')
+    parser.add_argument('--sizes', nargs='*', type=int, default=list(DEFAULT_SIZES), help='Thumbnail widths in pixels')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes')
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for source_dir in args.dirs:
+            if not os.path.isdir(source_dir):
+                print(f'Skipping {source_dir}: not a directory')
+                continue
+            start = time.perf_counter()
+            generated, reused = update_directory(source_dir, args.cache_dir, args.sizes, executor)
+            print(f'{source_dir}: {generated} generated, {reused} cached in {time.perf_counter() - start:.2f}s')
+
+if __name__ == '__main__':
+    main()
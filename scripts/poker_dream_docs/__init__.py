@@ -0,0 +1,34 @@
+"""
+Shared building blocks for the Poker Dream document generators
+Importing the package is cheap: submodules load on first attribute access,
+so a pptx-only job that touches brand or doc_output never imports
+python-docx.
+
+    brand                 palette as hex strings (no third-party imports)
+    manifest              client manifest loading and validation (stdlib only)
+    doc_output            save_document/save_bytes/is_path for paths, streams or bytes
+    render_cache          content-addressed cache of whole rendered documents
+    package_zip           part-by-part ZIP writer with per-part compression
+    docx_elements         prototype OXML elements, deep-copied on use
+    docx_helpers          docx brand colors, shading, rules, header/body helpers
+    docx_styles           named paragraph/character styles
+    docx_tables           one-pass styled tables
+    docx_template_cache   cloned base documents
+    docx_section_cache    on-disk cache of rendered sections
+    pdf_fonts             standard PDF font metrics, cached per process
+    pdf_export            one-pass PDF layout of built docx Documents
+"""
+
+import importlib
+
+SUBMODULES = ('brand', 'manifest', 'doc_output', 'render_cache', 'package_zip', 'docx_elements',
+              'docx_helpers', 'docx_styles', 'docx_tables', 'docx_template_cache', 'docx_section_cache',
+              'pdf_fonts', 'pdf_export')
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(list(globals()) + list(SUBMODULES))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Poker Dream brand palette
+Colors as RRGGBB hex strings, shared by the docx and pptx builders. Kept free
+of python-docx/python-pptx imports so any job can read it cheaply; each
+builder wraps the values in its own library's RGBColor.
+"""
+
+# Proposal documents
+PRIMARY = '2C3E50'      # Dark Blue
+SECONDARY = '34495E'    # Slate
+ACCENT = 'C0A062'       # Gold
+TEXT = '333333'         # Dark Gray
+SUCCESS = '27AE60'      # Green
+DANGER = 'C0392B'       # Red
+TABLE_HEADER_TEXT = 'FFFFFF'
+TABLE_BAND = 'F8F9FA'
+
+# Ecosystem deck, matching the PDF
+DECK_COLORS = {
+    'gold': 'C9A227',  # Gold/Mustard
+    'green': '2D5A3D',  # Dark Green
+    'light_green': '4A7C59',
+    'black': '1A1A1A',
+    'dark_gray': '333333',
+    'light_gray': 'F5F5F0',  # Off-white background
+    'white': 'FFFFFF',
+    'red': 'C0392B',
+}
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Output helpers shared by the document generators
+Lets every builder write to a file path, to a file-like object (an HTTP
+response, an object-store upload stream) or hand back the package bytes
+"""
+
+from io import BytesIO
+import os
+import sys
+
+from .package_zip import DEFAULT_LEVEL, source_date, write_package
+
+def save_document(document, output=None, level=DEFAULT_LEVEL, report=None, reproducible=None):
+    """Save a Document or Presentation to output, or return its bytes
+
+    output may be a file path, a writable binary file-like object, '-' for
+    stdout, or None to get the package bytes back without touching disk.
+    Parts are written by package_zip at deflate level; pass a list as report
+    to collect per-part sizes. With reproducible, timestamps are pinned to
+    source_date() so identical content saves to identical bytes; it defaults
+    to on when SOURCE_DATE_EPOCH is set.
+    """
+    if reproducible is None:
+        reproducible = bool(os.environ.get('SOURCE_DATE_EPOCH'))
+    timestamp = source_date() if reproducible else None
+    if output is None:
+        stream = BytesIO()
+        parts = write_package(document, stream, level, timestamp)
+        result = stream.getvalue()
+    elif output == '-':
+        parts = write_package(document, sys.stdout.buffer, level, timestamp)
+        sys.stdout.buffer.flush()
+        result = output
+    else:
+        parts = write_package(document, output, level, timestamp)
+        result = output
+    if report is not None:
+        report.extend(parts)
+    return result
+
+def save_bytes(data, output=None):
+    """Write already-built package bytes to output, as save_document would"""
+    if output is None:
+        return data
+    if output == '-':
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    elif is_path(output):
+        with open(output, 'wb') as f:
+            f.write(data)
+    else:
+        output.write(data)
+    return output
+
+def is_path(output):
+    """Return True if output names a file on disk"""
+    return isinstance(output, (str, os.PathLike)) and output != '-'
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Prototype OXML elements for the docx generators
+Each recurring element (the gold rule paragraph, page breaks, styled
+paragraph skeletons) is parsed once and deep-copied on use, instead of being rebuilt with OxmlElement and qn() every time.
+Deep copies keep python-docx's element classes.
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+
+from .brand import ACCENT
+
+# 6pt before and after, gold bottom border
+RULE_XML = (f'<w:p {nsdecls("w")}><w:pPr>'
+            f'<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="{ACCENT}"/></w:pBdr>'
+            f'<w:spacing w:before="120" w:after="120"/></w:pPr></w:p>')
+
+PAGE_BREAK_XML = f'<w:p {nsdecls("w")}><w:r><w:br w:type="page"/></w:r></w:p>'
+
+_RULE = parse_xml(RULE_XML)
+_PAGE_BREAK = parse_xml(PAGE_BREAK_XML)
+
+@lru_cache(maxsize=None)
+def _styled_paragraph(style_id):
+    return parse_xml(f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr></w:p>')
+
+def _append_paragraph(doc, prototype):
+    p = doc.element.body._insert_p(deepcopy(prototype))
+    return Paragraph(p, doc._body)
+
+def append_rule(doc):
+    """Append a gold rule paragraph to the document body"""
+    return _append_paragraph(doc, _RULE)
+
+def append_page_break(doc):
+    """Append a paragraph holding a page break to the document body"""
+    return _append_paragraph(doc, _PAGE_BREAK)
+
+def append_styled_paragraph(doc, style_id):
+    """Append an empty paragraph using style_id to the document body"""
+    return _append_paragraph(doc, _styled_paragraph(style_id))
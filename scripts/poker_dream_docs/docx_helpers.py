@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Shared python-docx helpers for the proposal generators
+Brand colors as docx RGBColors plus the cell shading, rule and styled
+header/body paragraph helpers both proposal builders use
+"""
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import RGBColor
+
+from . import brand
+from .docx_elements import append_page_break, append_rule
+from .docx_styles import add_styled_paragraph, add_styled_run
+
+# Brand Colors
+PRIMARY_COLOR = RGBColor.from_string(brand.PRIMARY)
+SECONDARY_COLOR = RGBColor.from_string(brand.SECONDARY)
+ACCENT_COLOR = RGBColor.from_string(brand.ACCENT)
+TEXT_COLOR = RGBColor.from_string(brand.TEXT)
+SUCCESS_COLOR = RGBColor.from_string(brand.SUCCESS)
+DANGER_COLOR = RGBColor.from_string(brand.DANGER)
+
+def set_cell_shading(cell, color):
+    """Set cell background color"""
+    shading = OxmlElement('w:shd')
+    shading.set(qn('w:fill'), color)
+    cell._tc.get_or_add_tcPr().append(shading)
+
+def add_horizontal_line(doc):
+    """Add a horizontal line"""
+    return append_rule(doc)
+
+def add_page_break(doc):
+    """Start a new page"""
+    return append_page_break(doc)
+
+def add_section_header(doc, title):
+    """Add a section header"""
+    add_styled_paragraph(doc, 'PDSectionHeader', title)
+    add_horizontal_line(doc)
+
+def add_subsection_header(doc, title):
+    """Add a subsection header"""
+    add_styled_paragraph(doc, 'PDSubsectionHeader', title)
+
+def add_h3_header(doc, title):
+    """Add a h3 header"""
+    add_styled_paragraph(doc, 'PDHeading3', title)
+
+def add_bullet_point(doc, text, color=TEXT_COLOR, marker='•'):
+    """Add a bullet point"""
+    return add_styled_paragraph(doc, 'PDBullet', f'{marker} {text}', color)
+
+def add_paragraph_text(doc, text, bold=False, italic=False, color=TEXT_COLOR):
+    """Add paragraph text"""
+    return add_styled_paragraph(doc, 'PDBody', text, color, bold, italic)
+
+def add_labeled_text(doc, label, text, label_color=PRIMARY_COLOR):
+    """Add body text led by a bold colored label"""
+    p = add_styled_paragraph(doc, 'PDBody', label, label_color, bold=True)
+    add_styled_run(p, text)
+    return p
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of rendered document sections
+Each section is keyed by a hash of its builder's source code, the shared
+poker_dream_docs helpers it renders through, and its inputs.
+On a miss the section is rendered into the document as usual and the body
+elements it added are stored as an OXML fragment; on a hit the stored
+fragment is spliced into the body without running the builder.
+Sections must only reference styles defined by the base document and must not
+add relationships (images, hyperlinks), since fragments carry neither.
+"""
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from lxml import etree
+import hashlib
+import inspect
+import json
+import os
+
+from .render_cache import helpers_version
+
+# Bump when the fragment format changes
+CACHE_VERSION = 2
+
+_SOURCES = {}
+
+def section_key(add_section, inputs):
+    """Return the content hash for a section builder and its inputs"""
+    source = _SOURCES.get(add_section)
+    if source is None:
+        source = _SOURCES[add_section] = inspect.getsource(add_section)
+    payload = json.dumps([CACHE_VERSION, helpers_version(), add_section.__module__, add_section.__qualname__,
+                          source, inputs],
+                         ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def render_cached(doc, cache_dir, add_section, *inputs):
+    """Render add_section(doc, *inputs), reusing a cached fragment if present
+
+    Returns True on a cache hit.
+    """
+    body = doc.element.body
+    # Body content always goes before the trailing w:sectPr
+    tail = 1 if body.sectPr is not None else 0
+    path = os.path.join(cache_dir, section_key(add_section, list(inputs)) + '.xml')
+
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            fragment = parse_xml(f.read())
+        for element in list(fragment):
+            body.insert(len(body) - tail, element)
+        return True
+
+    before = len(body) - tail
+    add_section(doc, *inputs)
+    added = body[before:len(body) - tail]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fragment = (f'<w:body {nsdecls("w")}>'.encode('utf-8')
+                + b''.join(etree.tostring(element) for element in added)
+                + b'</w:body>')
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(fragment)
+    os.replace(tmp_path, path)
+    return False
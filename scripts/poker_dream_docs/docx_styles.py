@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Named brand styles for the docx generators
+Defines the Poker Dream paragraph and character styles once in styles.xml so
+content paragraphs and runs reference them by style ID instead of carrying
+their own size/bold/color formatting
+"""
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from .brand import ACCENT, DANGER, PRIMARY, SECONDARY, SUCCESS, TEXT
+from .docx_elements import append_styled_paragraph
+
+# style ID -> (display name, size in pt, bold, color hex, extra w:pPr markup)
+PARAGRAPH_STYLES = {
+    'PDBody': ('PD Body', 11, False, TEXT, ''),
+    'PDSectionHeader': ('PD Section Header', 18, True, PRIMARY, ''),
+    'PDSubsectionHeader': ('PD Subsection Header', 14, True, SECONDARY, ''),
+    'PDHeading3': ('PD Heading 3', 12, True, SECONDARY, ''),
+    'PDBullet': ('PD Bullet', 11, False, TEXT, ''),
+    'PDTOCItem': ('PD TOC Item', 11, False, TEXT, '<w:spacing w:after="160"/><w:ind w:left="720"/>'),
+}
+
+# style ID -> (display name, color hex)
+CHARACTER_STYLES = {
+    'PDPrimary': ('PD Primary', PRIMARY),
+    'PDSecondary': ('PD Secondary', SECONDARY),
+    'PDAccent': ('PD Accent', ACCENT),
+    'PDText': ('PD Text', TEXT),
+    'PDSuccess': ('PD Success', SUCCESS),
+    'PDDanger': ('PD Danger', DANGER),
+}
+
+# Brand color hex -> character style ID, for helpers that take an RGBColor
+COLOR_STYLES = {color: style_id for style_id, (_, color) in CHARACTER_STYLES.items()}
+
+def _paragraph_style_xml(style_id, name, size, bold, color, ppr):
+    bold_xml = '<w:b/><w:bCs/>' if bold else ''
+    return (f'<w:style {nsdecls("w")} w:type="paragraph" w:customStyle="1" w:styleId="{style_id}">'
+            f'<w:name w:val="{name}"/><w:basedOn w:val="Normal"/><w:qFormat/>'
+            f'<w:pPr>{ppr}</w:pPr>'
+            f'<w:rPr>{bold_xml}<w:color w:val="{color}"/>'
+            f'<w:sz w:val="{size * 2}"/><w:szCs w:val="{size * 2}"/></w:rPr></w:style>')
+
+def _character_style_xml(style_id, name, color):
+    return (f'<w:style {nsdecls("w")} w:type="character" w:customStyle="1" w:styleId="{style_id}">'
+            f'<w:name w:val="{name}"/><w:basedOn w:val="DefaultParagraphFont"/>'
+            f'<w:rPr><w:color w:val="{color}"/></w:rPr></w:style>')
+
+def ensure_styles(doc):
+    """Add the brand styles to the document's styles.xml once"""
+    styles = doc.styles.element
+    for style_id, spec in PARAGRAPH_STYLES.items():
+        if styles.get_by_id(style_id) is None:
+            styles.append(parse_xml(_paragraph_style_xml(style_id, *spec)))
+    for style_id, spec in CHARACTER_STYLES.items():
+        if styles.get_by_id(style_id) is None:
+            styles.append(parse_xml(_character_style_xml(style_id, *spec)))
+
+def add_styled_run(p, text, color=None, bold=False, italic=False):
+    """Add a run that takes its color from a brand character style"""
+    run = p.add_run(text)
+    style_id = COLOR_STYLES.get(str(color)) if color is not None else None
+    if style_id:
+        run._r.style = style_id
+    elif color is not None:
+        run.font.color.rgb = color
+    if bold:
+        run.bold = True
+    if italic:
+        run.italic = True
+    return run
+
+def add_styled_paragraph(doc, style_id, text=None, color=None, bold=False, italic=False):
+    """Add a paragraph using a brand paragraph style, optionally with one run"""
+    p = append_styled_paragraph(doc, style_id)
+    if str(color) == PARAGRAPH_STYLES[style_id][3]:
+        # Already the paragraph style's color
+        color = None
+    if text is not None:
+        add_styled_run(p, text, color, bold, italic)
+    return p
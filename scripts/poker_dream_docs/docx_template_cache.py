@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Cache of prebuilt base documents for the docx generators
+The invariant prefix of a document (margins, cover page, table of contents) is
+built once per key, saved to package bytes and cloned for every new document.
+The least recently used keys are dropped beyond MAX_TEMPLATES, so per-client
+keys in a long-running process stay bounded.
+"""
+
+from collections import OrderedDict
+from io import BytesIO
+from docx import Document
+
+MAX_TEMPLATES = 32
+
+# key -> (package bytes, {slot name: paragraph index}), least recently used first
+_TEMPLATES = OrderedDict()
+
+def base_document(key, build, *args):
+    """Return a fresh copy of the base document that build(doc, *args) produces
+
+    build may return {name: paragraph} for paragraphs the caller fills in per
+    document; the cloned document's matching paragraphs are returned alongside it.
+    """
+    entry = _TEMPLATES.get(key)
+    if entry is not None:
+        _TEMPLATES.move_to_end(key)
+    else:
+        doc = Document()
+        slots = build(doc, *args) or {}
+        body = [p._p for p in doc.paragraphs]
+        slot_indexes = {name: body.index(p._p) for name, p in slots.items()}
+        stream = BytesIO()
+        doc.save(stream)
+        entry = _TEMPLATES[key] = (stream.getvalue(), slot_indexes)
+        while len(_TEMPLATES) > MAX_TEMPLATES:
+            _TEMPLATES.popitem(last=False)
+
+    blob, slot_indexes = entry
+    doc = Document(BytesIO(blob))
+    paragraphs = doc.paragraphs
+    return doc, {name: paragraphs[index] for name, index in slot_indexes.items()}
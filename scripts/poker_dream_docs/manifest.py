@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Client manifests for the proposal builder
+Default client fields, CSV/JSONL manifest loading, output naming and
+validation. Uses only the standard library so manifests can be checked
+without importing python-docx.
+"""
+
+import csv
+import json
+import re
+
+# Default client fields - used as-is for the single hardcoded proposal and as
+# the fallback for any field a manifest row leaves out
+DEFAULT_CLIENT = {
+    'client_name': '',
+    'version': '2.0',
+    'date': '5 December 2025',
+    'validity': '30 days (until 5 January 2026)',
+    'pricing': [
+        ['Total Development Fee', 'RM 250,000 (one-time)'],
+        ['Monthly Support', 'RM 11,000 – RM 20,000 depending on option'],
+    ],
+    'milestones': [
+        ['Contract Signing', 'Upon signing', 'RM 62,500', '25%'],
+        ['Backend Complete', 'Week 5', 'RM 75,000', '30%'],
+        ['Admin + Mobile Alpha', 'Week 9', 'RM 75,000', '30%'],
+        ['Final Delivery', 'Week 12', 'RM 37,500', '15%'],
+    ],
+}
+
+# Manifest fields that hold table rows rather than plain text
+TABLE_FIELDS = ('pricing', 'milestones')
+
+def load_manifest(path):
+    """Load client rows from a .csv or .jsonl manifest
+
+    Rows that are not objects are kept as they are for validate_manifest to
+    report, as are a CSV row's extra cells (under the key None). A table
+    cell that is not valid JSON raises ValueError naming the row and field.
+    """
+    clients = []
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                clients.append(row)
+                continue
+            client = {key: value for key, value in row.items() if value not in (None, '')}
+            for field in TABLE_FIELDS:
+                # CSV cells carry table rows as JSON-encoded lists
+                if isinstance(client.get(field), str):
+                    try:
+                        client[field] = json.loads(client[field])
+                    except ValueError as e:
+                        raise ValueError(f'row {index + 1}: {field} is not valid JSON ({e})') from None
+            clients.append(client)
+    return clients
+
+def output_filename(client, index):
+    """Pick the output file name for a manifest row"""
+    if client.get('output'):
+        return client['output']
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', client.get('client_name', '')).strip('_')
+    return f'POKER_DREAM_PROPOSAL_{slug or index + 1}.docx'
+
+def validate_manifest(clients):
+    """Return a list of problems found in loaded manifest rows"""
+    known = set(DEFAULT_CLIENT) | {'output'}
+    errors = []
+    outputs = {}
+    for index, client in enumerate(clients):
+        row = f'row {index + 1}'
+        found = len(errors)
+        if not isinstance(client, dict):
+            errors.append(f'{row}: must be an object of client fields')
+            continue
+        if None in client:
+            errors.append(f'{row}: extra cells')
+        for field in sorted(set(client) - known - {None}):
+            errors.append(f'{row}: unknown field {field!r}')
+        for field in sorted(known & set(client) - set(TABLE_FIELDS)):
+            if not isinstance(client[field], str):
+                errors.append(f'{row}: {field} must be a string')
+        for field in TABLE_FIELDS:
+            if field not in client:
+                continue
+            columns = len(DEFAULT_CLIENT[field][0])
+            table = client[field]
+            if not isinstance(table, list) or not all(isinstance(cells, list) for cells in table):
+                errors.append(f'{row}: {field} must be a list of rows')
+                continue
+            for number, cells in enumerate(table, 1):
+                if len(cells) != columns:
+                    errors.append(f'{row}: {field} row {number} has {len(cells)} cells, expected {columns}')
+        if len(errors) > found:
+            continue
+        filename = output_filename(client, index)
+        if filename in outputs:
+            errors.append(f'{row}: output {filename} already used by row {outputs[filename] + 1}')
+        outputs.setdefault(filename, index)
+    return errors
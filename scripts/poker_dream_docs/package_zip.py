@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+OPC package writer with per-part compression
+Writes a python-docx Document or python-pptx Presentation as a ZIP one part
+at a time, serializing each part just before it is written so only one part
+is held in memory. XML and everything else is deflated at a chosen level;
+media (PNG, JPEG, GIF, audio/video) is stored as is when deflating would
+save little, as it usually does for already-compressed data.
+Returns per-part sizes for reporting. Members of an existing package can
+also be copied into a new one without being decompressed.
+
+Given a fixed timestamp the output is reproducible: every ZIP entry and the
+core properties' created/modified dates carry that time, and parts are
+written in part-name order, so identical content always gives identical
+bytes (for the same zlib).
+"""
+
+from datetime import datetime, timezone
+import copy
+import os
+import struct
+import time
+import zipfile
+import zlib
+
+# Part extensions whose data is usually already compressed
+STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.mp3', '.m4a', '.mp4', '.mov', '.wdp')
+# Such parts are stored unless deflating brings them below this share of their size
+STORE_RATIO = 0.98
+
+DEFAULT_LEVEL = 6
+
+# The earliest time a ZIP entry can hold
+ZIP_EPOCH = datetime(1980, 1, 1, tzinfo=timezone.utc)
+
+def source_date():
+    """Return the fixed time for reproducible output: SOURCE_DATE_EPOCH, else 1980-01-01 UTC"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not epoch:
+        return ZIP_EPOCH
+    return max(datetime.fromtimestamp(int(epoch), timezone.utc), ZIP_EPOCH)
+
+def _package_items(document, ordered=False):
+    """Yield (member name, blob or callable returning it) for every item in the package
+
+    With ordered, parts come in part-name order rather than relationship-walk
+    order.
+    """
+    if hasattr(document, 'slides'):
+        from pptx.opc.oxml import serialize_part_xml
+        from pptx.opc.serialized import _ContentTypesItem
+
+        package = document.part.package
+        parts = tuple(package.iter_parts())
+        yield '[Content_Types].xml', serialize_part_xml(_ContentTypesItem.xml_for(parts))
+        pkg_rels = package._rels
+    else:
+        from docx.opc.pkgwriter import _ContentTypesItem
+
+        package = document.part.package
+        parts = list(package.parts)
+        for part in parts:
+            part.before_marshal()
+        yield '[Content_Types].xml', _ContentTypesItem.from_parts(parts).blob
+        pkg_rels = package.rels
+
+    if ordered:
+        parts = sorted(parts, key=lambda part: str(part.partname))
+    yield '_rels/.rels', pkg_rels.xml
+    for part in parts:
+        yield part.partname.membername, lambda part=part: part.blob
+        if len(part.rels):
+            yield part.partname.rels_uri.membername, lambda part=part: part.rels.xml
+
+def _store(name, data, level):
+    """Return True if a part should be stored rather than deflated"""
+    if level == 0:
+        return True
+    if os.path.splitext(name)[1].lower() not in STORED_EXTENSIONS:
+        return False
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return len(compressor.compress(data)) + len(compressor.flush()) >= len(data) * STORE_RATIO
+
+def write_package(document, stream, level=DEFAULT_LEVEL, timestamp=None):
+    """Write document's package to a path or writable binary stream
+
+    level is the deflate level (0-9) for non-media parts. With timestamp (an
+    aware datetime, see source_date) the output is reproducible. Returns a
+    list of {'name', 'size', 'compressed', 'stored'} dicts in archive order.
+    """
+    report = []
+    if timestamp is None:
+        date_time = time.localtime()[:6]
+    else:
+        timestamp = max(timestamp.astimezone(timezone.utc), ZIP_EPOCH)
+        date_time = timestamp.utctimetuple()[:6]
+        core_properties = document.core_properties
+        # Core properties are written as UTC (...Z)
+        core_properties.created = core_properties.modified = timestamp.replace(tzinfo=None)
+    with zipfile.ZipFile(stream, 'w') as zf:
+        for name, blob in _package_items(document, ordered=timestamp is not None):
+            data = blob() if callable(blob) else blob
+            stored = _store(name, data, level)
+            info = zipfile.ZipInfo(name, date_time)
+            if timestamp is not None:
+                # The host OS is recorded in each entry; pin it
+                info.create_system = 3
+            info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+            zf.writestr(info, data, compresslevel=None if stored else level)
+            report.append({'name': name, 'size': info.file_size, 'compressed': info.compress_size, 'stored': stored})
+    return report
+
+def read_raw_members(path):
+    """Return [(ZipInfo, compressed bytes)] for every member of a ZIP, without decompressing"""
+    members = []
+    with zipfile.ZipFile(path) as zf, open(path, 'rb') as f:
+        for info in zf.infolist():
+            f.seek(info.header_offset)
+            header = f.read(30)
+            # The local header's name and extra field lengths can differ from the central directory's
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            members.append((info, f.read(info.compress_size)))
+    return members
+
+def write_raw_members(stream, members, replacements, level=DEFAULT_LEVEL):
+    """Write members from read_raw_members to a path or stream as a new ZIP
+
+    Members are copied byte for byte, still compressed, except those named
+    in replacements ({name: new bytes}), which are deflated at level. Returns
+    the same report as write_package.
+    """
+    report = []
+    with zipfile.ZipFile(stream, 'w') as zf:
+        for info, raw in members:
+            if info.filename in replacements:
+                data = replacements[info.filename]
+                new_info = zipfile.ZipInfo(info.filename, info.date_time)
+                new_info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(new_info, data, compresslevel=level)
+                report.append({'name': info.filename, 'size': new_info.file_size,
+                               'compressed': new_info.compress_size, 'stored': False})
+                continue
+            info = copy.copy(info)
+            # Sizes and CRC are known, so they go in the local header instead of a data descriptor
+            info.flag_bits &= ~0x08
+            info.header_offset = zf.start_dir
+            zf.fp.write(info.FileHeader())
+            zf.fp.write(raw)
+            zf.start_dir = zf.fp.tell()
+            zf.filelist.append(info)
+            zf.NameToInfo[info.filename] = info
+            zf._didModify = True
+            report.append({'name': info.filename, 'size': info.file_size, 'compressed': info.compress_size,
+                           'stored': info.compress_type == zipfile.ZIP_STORED})
+    return report
+
+def format_report(report):
+    """Return a per-part size table, largest compressed first"""
+    lines = []
+    for item in sorted(report, key=lambda item: item['compressed'], reverse=True):
+        method = 'stored' if item['stored'] else 'deflate'
+        lines.append(f"{item['compressed'] / 1024:10.1f} KiB  {item['size'] / 1024:10.1f} KiB  {method:8} {item['name']}")
+    total = sum(item['compressed'] for item in report)
+    lines.append(f'{total / 1024:10.1f} KiB  {sum(item["size"] for item in report) / 1024:10.1f} KiB  '
+                 f'total ({len(report)} parts)')
+    return '\n'.join(lines)
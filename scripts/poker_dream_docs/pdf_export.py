@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Direct PDF export for the docx builders
+Lays a built python-docx Document out onto PDF pages in a single pass and
+writes the PDF itself, so no office suite is involved. Covers what the
+builders emit: paragraph, character and table styles (resolved once per
+style per document), run bold/italic/size/color, alignment, indents and
+spacing, rule borders, page breaks, and tables with header row, banding and
+cell shading. Text is set in the standard Helvetica fonts (pdf_fonts) so
+nothing is embedded; drawings are skipped.
+"""
+
+import os
+import re
+import zlib
+
+from docx.oxml.ns import nsmap, qn
+
+from .doc_output import is_path, save_bytes
+from .pdf_fonts import DINGBATS, FONTS, encode, font_resource, split_dingbats, text_width
+
+# Line height as a multiple of font size, and where the baseline sits in it
+LINE_HEIGHT = 1.15
+ASCENT = 0.9
+# Word's default cell margins (0.08 in) and tab stops (0.5 in), in points
+CELL_PADDING = 5.4
+TAB_STOP = 36
+EMU_PER_POINT = 12700
+# US Letter with 1 in margins, for documents without section properties
+DEFAULT_PAGE = {'width': 612, 'height': 792, 'top': 72, 'bottom': 72, 'left': 72, 'right': 72}
+
+NS = {'w': nsmap['w']}
+W_P, W_R, W_T, W_TAB, W_BR, W_CR = (qn(f'w:{tag}') for tag in ('p', 'r', 't', 'tab', 'br', 'cr'))
+W_TBL, W_TR, W_TC = qn('w:tbl'), qn('w:tr'), qn('w:tc')
+W_PPR, W_RPR, W_TCPR, W_TBLPR = qn('w:pPr'), qn('w:rPr'), qn('w:tcPr'), qn('w:tblPr')
+W_PSTYLE, W_RSTYLE, W_TBLSTYLE = qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle')
+W_JC, W_SPACING, W_IND, W_B, W_I, W_SZ, W_COLOR, W_SHD = (
+    qn(f'w:{tag}') for tag in ('jc', 'spacing', 'ind', 'b', 'i', 'sz', 'color', 'shd'))
+W_STYLE, W_BASEDON, W_TBLSTYLEPR, W_TBLLOOK, W_GRIDCOL, W_GRIDSPAN = (
+    qn(f'w:{tag}') for tag in ('style', 'basedOn', 'tblStylePr', 'tblLook', 'gridCol', 'gridSpan'))
+W_VAL, W_TYPE, W_STYLEID, W_DEFAULT, W_FILL, W_W = (
+    qn(f'w:{attr}') for attr in ('val', 'type', 'styleId', 'default', 'fill', 'w'))
+W_BEFORE, W_AFTER, W_LINE, W_LINERULE, W_LEFT, W_START, W_SPACE, W_FIRSTROW, W_NOHBAND = (
+    qn(f'w:{attr}') for attr in ('before', 'after', 'line', 'lineRule', 'left', 'start', 'space',
+                                 'firstRow', 'noHBand'))
+
+WORDS = re.compile(r'[^ ]+| +')
+
+def paragraph_props(ppr, props):
+    """Update paragraph props (align, before, after, line, indent, border) from a w:pPr"""
+    if ppr is None:
+        return props
+    jc = ppr.find(W_JC)
+    if jc is not None:
+        props['align'] = jc.get(W_VAL)
+    spacing = ppr.find(W_SPACING)
+    if spacing is not None:
+        if spacing.get(W_BEFORE) is not None:
+            props['before'] = int(spacing.get(W_BEFORE)) / 20
+        if spacing.get(W_AFTER) is not None:
+            props['after'] = int(spacing.get(W_AFTER)) / 20
+        if spacing.get(W_LINE) is not None and spacing.get(W_LINERULE, 'auto') == 'auto':
+            props['line'] = int(spacing.get(W_LINE)) / 240
+    ind = ppr.find(W_IND)
+    if ind is not None and (ind.get(W_LEFT) or ind.get(W_START)) is not None:
+        props['indent'] = int(ind.get(W_LEFT) or ind.get(W_START)) / 20
+    bottom = ppr.find('w:pBdr/w:bottom', NS)
+    if bottom is not None and bottom.get(W_VAL) not in ('nil', 'none'):
+        # (color, line width, gap above the line), in points
+        props['border'] = (bottom.get(W_COLOR, '000000'), int(bottom.get(W_SZ, 4)) / 8,
+                           int(bottom.get(W_SPACE, 0)))
+    return props
+
+def run_props(rpr, props):
+    """Update run props (bold, italic, size, color) from a w:rPr"""
+    if rpr is None:
+        return props
+    for tag, key in ((W_B, 'bold'), (W_I, 'italic')):
+        toggle = rpr.find(tag)
+        if toggle is not None:
+            props[key] = toggle.get(W_VAL) not in ('0', 'false', 'off')
+    size = rpr.find(W_SZ)
+    if size is not None:
+        props['size'] = int(size.get(W_VAL)) / 2
+    color = rpr.find(W_COLOR)
+    if color is not None and color.get(W_VAL) != 'auto':
+        props['color'] = color.get(W_VAL)
+    return props
+
+def load_styles(doc):
+    """Return the style context: style elements by ID plus document defaults"""
+    root = doc.styles.element
+    styles = {style.get(W_STYLEID): style for style in root.iter(W_STYLE)}
+    normal = next((style_id for style_id, style in styles.items()
+                   if style.get(W_TYPE) == 'paragraph' and style.get(W_DEFAULT) == '1'), None)
+    para = paragraph_props(root.find('w:docDefaults/w:pPrDefault/w:pPr', NS),
+                           {'align': 'left', 'before': 0, 'after': 0, 'line': 1, 'indent': 0, 'border': None})
+    run = run_props(root.find('w:docDefaults/w:rPrDefault/w:rPr', NS),
+                    {'bold': False, 'italic': False, 'size': 10, 'color': '000000'})
+    return {'styles': styles, 'normal': normal, 'para': para, 'run': run, 'resolved': {}}
+
+def _style_chain(ctx, style_id):
+    """Return a style and its basedOn ancestors, base first"""
+    chain = []
+    while style_id in ctx['styles'] and len(chain) < 16:
+        style = ctx['styles'][style_id]
+        chain.append(style)
+        based_on = style.find(W_BASEDON)
+        style_id = based_on.get(W_VAL) if based_on is not None else None
+    return reversed(chain)
+
+def _conditional(style, kind):
+    """Return the w:tblStylePr of a table style for a condition such as firstRow"""
+    return next((cond for cond in style.iterchildren(W_TBLSTYLEPR) if cond.get(W_TYPE) == kind), None)
+
+def style_props(ctx, para_style, table_style=None, conditions=()):
+    """Return (paragraph props, run props) for a paragraph style, optionally inside a table style"""
+    key = (para_style, table_style, conditions)
+    if key not in ctx['resolved']:
+        para, run = dict(ctx['para']), dict(ctx['run'])
+        for style in _style_chain(ctx, table_style):
+            paragraph_props(style.find(W_PPR), para)
+            run_props(style.find(W_RPR), run)
+            for kind in conditions:
+                cond = _conditional(style, kind)
+                if cond is not None:
+                    paragraph_props(cond.find(W_PPR), para)
+                    run_props(cond.find(W_RPR), run)
+        for style in _style_chain(ctx, para_style or ctx['normal']):
+            paragraph_props(style.find(W_PPR), para)
+            run_props(style.find(W_RPR), run)
+        ctx['resolved'][key] = para, run
+    return ctx['resolved'][key]
+
+def char_style_props(ctx, style_id):
+    """Return the run props a character style sets"""
+    key = ('char', style_id)
+    if key not in ctx['resolved']:
+        props = {}
+        for style in _style_chain(ctx, style_id):
+            run_props(style.find(W_RPR), props)
+        ctx['resolved'][key] = props
+    return ctx['resolved'][key]
+
+def paragraph_tokens(ctx, p, run_base):
+    """Yield (kind, text, props) for paragraph p: 'text', 'tab', 'newline' or 'page'"""
+    for r in p.iter(W_R):
+        # Runs of text boxes anchored in p belong to their own paragraphs
+        if next(r.iterancestors(W_P)) is not p:
+            continue
+        props = run_base
+        rpr = r.find(W_RPR)
+        if rpr is not None:
+            props = dict(run_base)
+            rstyle = rpr.find(W_RSTYLE)
+            if rstyle is not None:
+                props.update(char_style_props(ctx, rstyle.get(W_VAL)))
+            run_props(rpr, props)
+        for child in r:
+            if child.tag == W_T:
+                yield 'text', child.text or '', props
+            elif child.tag == W_TAB:
+                yield 'tab', '', props
+            elif child.tag in (W_BR, W_CR):
+                yield ('page' if child.get(W_TYPE) == 'page' else 'newline'), '', props
+
+def _width(text, props):
+    return text_width(text, props['bold']) * props['size'] / 1000
+
+def layout_lines(tokens, width, run_base):
+    """Break tokens into lines of at most width points
+
+    Returns [(items, font size, page_break)], items being [x, text, props,
+    advance] with consecutive same-props text merged.
+    """
+    lines = []
+    items = []
+    x = 0
+
+    def add(text, props, advance):
+        nonlocal x
+        if items and items[-1][2] == props:
+            items[-1][1] += text
+            items[-1][3] += advance
+        else:
+            items.append([x, text, props, advance])
+        x += advance
+
+    def flush(page_break=False):
+        nonlocal items, x
+        while items and not items[-1][1].strip():
+            items.pop()
+        if items:
+            items[-1][1] = items[-1][1].rstrip(' ')
+        size = max((item[2]['size'] for item in items), default=run_base['size'])
+        lines.append((items, size, page_break))
+        items, x = [], 0
+
+    for kind, text, props in tokens:
+        if kind == 'page':
+            flush(page_break=True)
+        elif kind == 'newline':
+            flush()
+        elif kind == 'tab':
+            add(' ', props, (x // TAB_STOP + 1) * TAB_STOP - x)
+        else:
+            for word in WORDS.findall(text):
+                advance = _width(word, props)
+                if word[0] == ' ':
+                    if items:
+                        add(word, props, advance)
+                    continue
+                if x + advance > width and items:
+                    flush()
+                while advance > width:
+                    # A word wider than the line: break it where it fits
+                    cut = 1
+                    while cut < len(word) and _width(word[:cut + 1], props) <= width - x:
+                        cut += 1
+                    add(word[:cut], props, _width(word[:cut], props))
+                    flush()
+                    word = word[cut:]
+                    advance = _width(word, props)
+                if word:
+                    add(word, props, advance)
+    # The paragraph mark after a trailing page break does not take a line
+    if items or not lines or not lines[-1][2]:
+        flush()
+    return lines
+
+def _rgb(hex_color):
+    return ' '.join(f'{int(hex_color[i:i + 2], 16) / 255:.3f}' for i in (0, 2, 4))
+
+def text_ops(items, x0, baseline):
+    """Return PDF operators drawing one line's items"""
+    ops = []
+    for x, text, props, _ in items:
+        if not text:
+            continue
+        x += x0
+        for dingbat, chars, advance in split_dingbats(text, props['bold']):
+            font = DINGBATS[0] if dingbat else font_resource(props['bold'], props['italic'])
+            ops.append(b'BT /%s %.2f Tf %s rg %.2f %.2f Td (%s) Tj ET' % (
+                font.encode(), props['size'], _rgb(props['color']).encode(), x, baseline, encode(chars)))
+            x += advance * props['size'] / 1000
+    return ops
+
+def _line_offset(align, width, items):
+    used = items[-1][0] + items[-1][3] if items else 0
+    if align == 'center':
+        return (width - used) / 2
+    if align in ('right', 'end'):
+        return width - used
+    return 0
+
+def new_page(state):
+    state['pages'].append([])
+    state['y'] = state['page']['top']
+
+def measure_paragraph(ctx, p, width, table_style=None, conditions=()):
+    """Lay out paragraph p; return (paragraph props, lines)"""
+    ppr = p.find(W_PPR)
+    para_style = None
+    if ppr is not None and ppr.find(W_PSTYLE) is not None:
+        para_style = ppr.find(W_PSTYLE).get(W_VAL)
+    para, run_base = style_props(ctx, para_style, table_style, conditions)
+    if ppr is not None:
+        para = paragraph_props(ppr, dict(para))
+        # Paragraph mark formatting sizes an empty line
+        if ppr.find(W_RPR) is not None:
+            run_base = run_props(ppr.find(W_RPR), dict(run_base))
+    lines = layout_lines(paragraph_tokens(ctx, p, run_base), width - para['indent'], run_base)
+    return para, lines
+
+def line_height(para, size):
+    return size * LINE_HEIGHT * para['line']
+
+def paragraph_height(para, lines):
+    height = para['before'] + sum(line_height(para, size) for _, size, _ in lines) + para['after']
+    if para['border']:
+        height += para['border'][2] + para['border'][1]
+    return height
+
+def draw_paragraph(ops, para, lines, x0, width, top):
+    """Append a measured paragraph's operators at top (PDF y, points) and return the y below it"""
+    y = top - para['before']
+    for items, size, _ in lines:
+        x = x0 + para['indent'] + _line_offset(para['align'], width - para['indent'], items)
+        ops.extend(text_ops(items, x, y - size * ASCENT))
+        y -= line_height(para, size)
+    if para['border']:
+        color, line_width, gap = para['border']
+        y -= gap + line_width / 2
+        ops.append(b'%s RG %.2f w %.2f %.2f m %.2f %.2f l S' % (
+            _rgb(color).encode(), line_width, x0 + para['indent'], y, x0 + width, y))
+        y -= line_width / 2
+    return y - para['after']
+
+def render_paragraph(ctx, state, p):
+    """Place a body paragraph, breaking pages between lines as needed"""
+    page = state['page']
+    x0 = page['left']
+    width = page['width'] - page['left'] - page['right']
+    bottom = page['height'] - page['bottom']
+    para, lines = measure_paragraph(ctx, p, width)
+
+    state['y'] += para['before']
+    for index, line in enumerate(lines):
+        items, size, page_break = line
+        if state['y'] + line_height(para, size) > bottom and state['y'] > page['top']:
+            new_page(state)
+        last = index == len(lines) - 1
+        piece = dict(para, before=0, after=para['after'] if last else 0, border=para['border'] if last else None)
+        top = page['height'] - state['y']
+        state['y'] = page['height'] - draw_paragraph(state['pages'][-1], piece, [line], x0, width, top)
+        if page_break:
+            new_page(state)
+    if not lines:
+        state['y'] += para['after']
+
+def render_table(ctx, state, tbl):
+    """Place a table row by row; a row that does not fit starts a new page"""
+    page = state['page']
+    content_width = page['width'] - page['left'] - page['right']
+    bottom = page['height'] - page['bottom']
+
+    tblpr = tbl.find(W_TBLPR)
+    table_style = None
+    first_row, banding, align = False, False, 'left'
+    if tblpr is not None:
+        if tblpr.find(W_TBLSTYLE) is not None:
+            table_style = tblpr.find(W_TBLSTYLE).get(W_VAL)
+        look = tblpr.find(W_TBLLOOK)
+        if look is not None:
+            first_row = look.get(W_FIRSTROW) == '1'
+            banding = look.get(W_NOHBAND) != '1'
+        if tblpr.find(W_JC) is not None:
+            align = tblpr.find(W_JC).get(W_VAL)
+    styles = list(_style_chain(ctx, table_style))
+
+    grid = [int(col.get(W_W)) / 20 for col in tbl.iterfind('w:tblGrid/w:gridCol', NS)]
+    x0 = page['left'] + (_line_offset(align, content_width, [[0, '', None, sum(grid)]]) if grid else 0)
+
+    data_rows = 0
+    for index, tr in enumerate(tbl.iterchildren(W_TR)):
+        if index == 0 and first_row:
+            conditions = ('firstRow',)
+        else:
+            conditions = ('band2Horz' if banding and data_rows % 2 else 'band1Horz',)
+            data_rows += 1
+
+        cells = []
+        column = 0
+        for tc in tr.iterchildren(W_TC):
+            tcpr = tc.find(W_TCPR)
+            span = 1
+            if tcpr is not None and tcpr.find(W_GRIDSPAN) is not None:
+                span = int(tcpr.find(W_GRIDSPAN).get(W_VAL))
+            width = sum(grid[column:column + span])
+            shading = tcpr.find(W_SHD) if tcpr is not None else None
+            if shading is None:
+                for style in styles:
+                    cond = _conditional(style, conditions[0])
+                    if cond is not None and cond.find('w:tcPr/w:shd', NS) is not None:
+                        shading = cond.find('w:tcPr/w:shd', NS)
+            fill = shading.get(W_FILL) if shading is not None else None
+            paragraphs = [measure_paragraph(ctx, p, width - 2 * CELL_PADDING, table_style, conditions)
+                          for p in tc.iterchildren(W_P)]
+            height = sum(paragraph_height(para, lines) for para, lines in paragraphs)
+            cells.append((column, width, fill, paragraphs, height))
+            column += span
+
+        row_height = max((cell[4] for cell in cells), default=0)
+        if state['y'] + row_height > bottom and state['y'] > page['top']:
+            new_page(state)
+        ops = state['pages'][-1]
+        top = page['height'] - state['y']
+        for column, width, fill, paragraphs, _ in cells:
+            x = x0 + sum(grid[:column])
+            if fill and fill != 'auto':
+                ops.append(b'%s rg %.2f %.2f %.2f %.2f re f' % (_rgb(fill).encode(), x, top - row_height, width, row_height))
+            y = top
+            for para, lines in paragraphs:
+                y = draw_paragraph(ops, para, lines, x + CELL_PADDING, width - 2 * CELL_PADDING, y)
+        state['y'] += row_height
+
+def page_geometry(doc):
+    """Return the page size and margins in points from the last section"""
+    section = doc.sections[-1] if len(doc.sections) else None
+    page = dict(DEFAULT_PAGE)
+    if section is not None:
+        for key, value in (('width', section.page_width), ('height', section.page_height),
+                           ('top', section.top_margin), ('bottom', section.bottom_margin),
+                           ('left', section.left_margin), ('right', section.right_margin)):
+            if value is not None:
+                page[key] = value / EMU_PER_POINT
+    return page
+
+def write_pdf(pages, width, height):
+    """Serialize pages (lists of content operators) as PDF bytes"""
+    fonts = list(FONTS.values()) + [DINGBATS]
+    first_page = 3 + len(fonts)
+    font_refs = ' '.join(f'/{name} {3 + i} 0 R' for i, (name, _) in enumerate(fonts))
+    kids = ' '.join(f'{first_page + 2 * i} 0 R' for i in range(len(pages)))
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode(),
+    ]
+    for name, base_font in fonts:
+        encoding = '' if (name, base_font) == DINGBATS else ' /Encoding /WinAnsiEncoding'
+        objects.append(f'<< /Type /Font /Subtype /Type1 /BaseFont /{base_font}{encoding} >>'.encode())
+    for index, ops in enumerate(pages):
+        content = zlib.compress(b'\n'.join(ops))
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width:.2f} {height:.2f}] '
+                       f'/Resources << /Font << {font_refs} >> >> /Contents {first_page + 2 * index + 1} 0 R >>'.encode())
+        objects.append(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(content), content))
+    objects.append(b'<< /Producer (poker_dream_docs) >>')
+
+    out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, len(objects), xref)
+    return bytes(out)
+
+def render_pdf(doc):
+    """Lay out a python-docx Document and return the PDF bytes"""
+    ctx = load_styles(doc)
+    page = page_geometry(doc)
+    state = {'page': page, 'pages': [], 'y': 0}
+    new_page(state)
+    for child in doc.element.body.iterchildren(W_P, W_TBL):
+        if child.tag == W_P:
+            render_paragraph(ctx, state, child)
+        else:
+            render_table(ctx, state, child)
+    return write_pdf(state['pages'], page['width'], page['height'])
+
+def is_pdf(output):
+    """Return True if output is a file path ending in .pdf"""
+    return is_path(output) and os.fspath(output).lower().endswith('.pdf')
+
+def pdf_filename(filename):
+    """Swap a .docx file name for its .pdf counterpart"""
+    return os.path.splitext(filename)[0] + '.pdf'
+
+def save_pdf(doc, output=None):
+    """Export doc as PDF to a path, a writable stream or '-', or return the bytes"""
+    return save_bytes(render_pdf(doc), output)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Metrics for the PDF standard fonts used by pdf_export
+Helvetica in its four styles (WinAnsiEncoding) plus ZapfDingbats for check
+and cross marks. Widths are in 1/1000 em, from the Adobe AFM files; accented
+Latin letters take the width of their base letter. Text widths are cached
+per process.
+"""
+
+from functools import lru_cache
+import unicodedata
+
+# (bold, italic) -> PDF resource name and base font
+FONTS = {
+    (False, False): ('F1', 'Helvetica'),
+    (True, False): ('F2', 'Helvetica-Bold'),
+    (False, True): ('F3', 'Helvetica-Oblique'),
+    (True, True): ('F4', 'Helvetica-BoldOblique'),
+}
+DINGBATS = ('F5', 'ZapfDingbats')
+
+# Characters 32-126
+REGULAR_ASCII = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+BOLD_ASCII = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+
+# Non-ASCII WinAnsi characters used in the proposals: (regular, bold)
+EXTRA_WIDTHS = {
+    '\u00a0': (278, 278), '©': (737, 737), '®': (737, 737), '°': (400, 400),
+    '×': (584, 584), '–': (556, 556), '—': (1000, 1000), '‘': (222, 278),
+    '’': (222, 278), '“': (333, 500), '”': (333, 500), '•': (350, 350),
+    '…': (1000, 1000), '€': (556, 556),
+}
+
+# Unicode mark -> (ZapfDingbats character, width)
+DINGBAT_MARKS = {
+    '✓': ('3', 755),
+    '✔': ('4', 761),
+    '✗': ('7', 744),
+    '✘': ('8', 776),
+}
+
+DEFAULT_WIDTH = 556
+
+def font_resource(bold, italic):
+    """Return the PDF resource name (F1-F4) for a Helvetica style"""
+    return FONTS[bool(bold), bool(italic)][0]
+
+@lru_cache(maxsize=1024)
+def char_width(char, bold):
+    """Width of one character in 1/1000 em"""
+    code = ord(char)
+    if 32 <= code <= 126:
+        return (BOLD_ASCII if bold else REGULAR_ASCII)[code - 32]
+    if char in EXTRA_WIDTHS:
+        return EXTRA_WIDTHS[char][bool(bold)]
+    if char in DINGBAT_MARKS:
+        return DINGBAT_MARKS[char][1]
+    base = unicodedata.normalize('NFD', char)[0]
+    if base != char and 32 <= ord(base) <= 126:
+        return char_width(base, bold)
+    return DEFAULT_WIDTH
+
+@lru_cache(maxsize=65536)
+def text_width(text, bold):
+    """Width of text in 1/1000 em (multiply by size / 1000 for points)"""
+    return sum(char_width(char, bold) for char in text)
+
+def split_dingbats(text, bold):
+    """Split text into (is_dingbat, text, width) segments, mapping marks to ZapfDingbats codes
+
+    Widths are in 1/1000 em and measured on the original characters, so they
+    match text_width.
+    """
+    segments = []
+    for char in text:
+        dingbat = char in DINGBAT_MARKS
+        width = char_width(char, bold)
+        char = DINGBAT_MARKS[char][0] if dingbat else char
+        if segments and segments[-1][0] == dingbat:
+            segments[-1][1] += char
+            segments[-1][2] += width
+        else:
+            segments.append([dingbat, char, width])
+    return [tuple(segment) for segment in segments]
+
+def encode(text):
+    """Encode text as a PDF literal string body in WinAnsiEncoding"""
+    data = text.encode('cp1252', errors='replace')
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of rendered document bytes
+A render is keyed by a hash of the builder name, the generator source code
+(every script and poker_dream_docs module, plus the python-docx and
+python-pptx versions) and the builder's JSON-normalized inputs. Identical
+inputs return the stored package bytes without building anything. The store
+is bounded in size; hits refresh an entry's mtime and the least recently
+used entries are evicted first.
+
+    <cache>/<sha256>.bin
+"""
+
+from functools import lru_cache
+import hashlib
+import json
+import os
+
+# Bump when the key or entry format changes
+CACHE_VERSION = 2
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(PACKAGE_DIR)
+LIBRARIES = ('python-docx', 'python-pptx')
+
+@lru_cache(maxsize=1)
+def code_version():
+    """Return a hash of the generator sources and library versions"""
+    return _source_version((SCRIPTS_DIR, PACKAGE_DIR))
+
+@lru_cache(maxsize=1)
+def helpers_version():
+    """Return a hash of the shared poker_dream_docs modules and library versions"""
+    return _source_version((PACKAGE_DIR,))
+
+def _source_version(directories):
+    from importlib import metadata
+    digest = hashlib.sha256()
+    for directory in directories:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith('.py'):
+                digest.update(name.encode('utf-8'))
+                with open(os.path.join(directory, name), 'rb') as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+    for library in LIBRARIES:
+        try:
+            version = metadata.version(library)
+        except metadata.PackageNotFoundError:
+            version = None
+        digest.update(f'{library}={version};'.encode('utf-8'))
+    return digest.hexdigest()
+
+def render_key(builder, inputs):
+    """Return the content hash for a builder and its inputs"""
+    payload = json.dumps([CACHE_VERSION, builder, code_version(), inputs],
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def evict(cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+    """Delete least recently used entries until the store fits in max_bytes; return how many"""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.bin'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another worker got there first
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+def cached_render(cache_dir, builder, inputs, render, max_bytes=DEFAULT_MAX_BYTES, stats=None):
+    """Return (package bytes, hit) for builder on inputs, calling render() only on a miss
+
+    render must return the package bytes. Pass a dict as stats to count
+    hits, misses, bytes served and evictions.
+    """
+    path = os.path.join(cache_dir, render_key(builder, inputs) + '.bin')
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = None
+    if data is not None:
+        # Mark as recently used; a concurrent eviction may already have removed it
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        hit, evicted = True, 0
+    else:
+        data = render()
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        hit, evicted = False, evict(cache_dir, max_bytes)
+
+    if stats is not None:
+        stats['hits'] = stats.get('hits', 0) + hit
+        stats['misses'] = stats.get('misses', 0) + (not hit)
+        stats['bytes_served'] = stats.get('bytes_served', 0) + (len(data) if hit else 0)
+        stats['evicted'] = stats.get('evicted', 0) + evicted
+    return data, hit
+
+def format_stats(stats):
+    """Return a one-line hit/miss summary"""
+    hits, misses = stats.get('hits', 0), stats.get('misses', 0)
+    rate = hits / (hits + misses) if hits + misses else 0
+    return (f"render cache: {hits} hits, {misses} misses ({rate:.0%} hit rate), "
+            f"{stats.get('bytes_served', 0) / 1024:.1f} KiB served from cache, {stats.get('evicted', 0)} evicted")
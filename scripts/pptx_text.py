@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Direct OOXML shape writer for the pptx generator
+Builds the complete p:sp element for a text box or card background, or the
+graphic frame for a table, as one XML string instead of creating it through
+python-pptx's object model and then setting fill, line and font properties
+one by one. The font face is inherited from the theme (see set_theme_font),
+so runs only carry size, weight and color.
+"""
+
+from xml.sax.saxutils import escape
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+THEME_FONT = etree.QName('http://schemas.openxmlformats.org/drawingml/2006/main', 'latin')
+
+# Built-in "No Style, No Grid" table style
+NO_STYLE_TABLE = '{2D5ABB26-0587-4C30-8999-92F81FD0307C}'
+
+# Theme style references python-pptx gives autoshapes (outline, fill, shadow, font)
+SHAPE_STYLE = (
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+)
+
+def set_theme_font(prs, typeface):
+    """Make typeface the theme's major and minor Latin font
+
+    Text boxes without an explicit typeface inherit it from the theme.
+    """
+    theme = prs.slide_master.part.part_related_by(RT.THEME)
+    root = etree.fromstring(theme.blob)
+    for latin in root.iter(THEME_FONT):
+        if latin.getparent().tag.endswith(('}majorFont', '}minorFont')):
+            latin.set('typeface', typeface)
+    theme._blob = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+def _run_props(size, bold, color):
+    bold_attr = ' b="1"' if bold else ''
+    return (f'<a:rPr sz="{int(size * 100)}"{bold_attr}>'
+            f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>')
+
+def paragraph_xml(text, size, color, bold=False, align='l', space_after=None):
+    """Return the a:p markup for one paragraph; newlines become line breaks"""
+    rpr = _run_props(size, bold, color)
+    spacing = f'<a:spcAft><a:spcPts val="{int(space_after.pt * 100)}"/></a:spcAft>' if space_after else ''
+    runs = f'<a:br>{rpr}</a:br>'.join(
+        f'<a:r>{rpr}<a:t>{escape(line)}</a:t></a:r>' for line in text.split('\n')
+    )
+    return f'<a:p><a:pPr algn="{align}">{spacing}</a:pPr>{runs}</a:p>'
+
+def _append_shape(slide, name, nv_props, left, top, width, height, geometry, body):
+    """Parse one p:sp from markup and append it to slide's shape tree"""
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    sp = parse_xml(
+        f'<p:sp {nsdecls("p", "a")}>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="{name} {shape_id - 1}"/>{nv_props}<p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{int(left)}" y="{int(top)}"/><a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>'
+        f'{geometry}</p:spPr>{body}</p:sp>'
+    )
+    shapes._spTree.insert_element_before(sp, 'p:extLst')
+    return shapes._shape_factory(sp)
+
+def add_textbox(slide, left, top, width, height, paragraphs):
+    """Append a word-wrapped text box holding paragraphs (a:p markup) to slide"""
+    return _append_shape(
+        slide, 'TextBox', '<p:cNvSpPr txBox="1"/>', left, top, width, height,
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/>',
+        f'<p:txBody><a:bodyPr wrap="square" rtlCol="0"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        f'{"".join(paragraphs)}</p:txBody>',
+    )
+
+def add_rounded_rectangle(slide, left, top, width, height, fill, line):
+    """Append a rounded rectangle with solid fill and outline colors to slide"""
+    return _append_shape(
+        slide, 'Rounded Rectangle', '<p:cNvSpPr/>', left, top, width, height,
+        f'<a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom>'
+        f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+        f'<a:ln><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:ln>',
+        SHAPE_STYLE,
+    )
+
+def _table_cell(paragraph, line):
+    border = f'<a:lnB w="9525"><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:lnB>' if line else ''
+    return (f'<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraph}</a:txBody>'
+            f'<a:tcPr marL="45720" marR="45720">{border}<a:noFill/></a:tcPr></a:tc>')
+
+def add_table(slide, left, top, col_widths, rows):
+    """Append an a:tbl graphic frame to slide
+
+    rows is a list of (height, bottom rule color or None, [a:p markup per
+    cell]). Cells are unfilled so the slide background shows through.
+    """
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    grid = ''.join(f'<a:gridCol w="{int(width)}"/>' for width in col_widths)
+    body = ''.join(
+        f'<a:tr h="{int(height)}">{"".join(_table_cell(cell, line) for cell in cells)}</a:tr>'
+        for height, line, cells in rows
+    )
+    frame = parse_xml(
+        f'<p:graphicFrame {nsdecls("p", "a")}>'
+        f'<p:nvGraphicFramePr><p:cNvPr id="{shape_id}" name="Table {shape_id - 1}"/>'
+        f'<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>'
+        f'<p:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+        f'<a:ext cx="{sum(int(width) for width in col_widths)}" cy="{sum(int(row[0]) for row in rows)}"/></p:xfrm>'
+        f'<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+        f'<a:tbl><a:tblPr firstRow="1"><a:tableStyleId>{NO_STYLE_TABLE}</a:tableStyleId></a:tblPr>'
+        f'<a:tblGrid>{grid}</a:tblGrid>{body}</a:tbl></a:graphicData></a:graphic></p:graphicFrame>'
+    )
+    shapes._spTree.insert_element_before(frame, 'p:extLst')
+    return shapes._shape_factory(frame)
+
+def bullet_paragraphs(items, font_size, color, bullet='• ', space_after=Pt(8)):
+    """Return a:p markup for a bulleted list"""
+    return [paragraph_xml(f'{bullet}{item}', font_size, color, space_after=space_after) for item in items]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Render the Poker Dream documents in parallel
+Fans the ecosystem deck, the business proposal, the website proposal and any
+per-client proposal variants out across a process pool
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import json
+import os
+import time
+
+from poker_dream_docs.doc_output import save_bytes, save_document
+
+# Builder name -> default output file name
+BUILDERS = {
+    'pptx': 'Poker_Dream_Ecosystem.pptx',
+    'proposal': 'POKER_DREAM_PROPOSAL.docx',
+    'website': 'Poker_Dream_Website_Proposal.docx',
+}
+
+def build_job(job):
+    """Build one job's Document or Presentation"""
+    builder = job['builder']
+    if builder == 'pptx':
+        import create_pptx
+        return create_pptx.build_presentation(workers=job.get('deck_workers', 1))
+    elif builder == 'proposal':
+        import create_proposal_docx
+        return create_proposal_docx.build_document(job.get('client'))
+    elif builder == 'website':
+        import create_website_proposal_docx
+        return create_website_proposal_docx.build_document()
+    raise ValueError(f'Unknown builder: {builder}')
+
+def job_inputs(job):
+    """Return everything besides the code that a job's output depends on, for the render cache"""
+    builder = job['builder']
+    if builder == 'pptx':
+        from deck_engine import DEFAULT_SPEC, load_spec, spec_assets
+        spec = load_spec(DEFAULT_SPEC)
+        return {'spec': spec, 'assets': spec_assets(spec)}
+    elif builder == 'proposal':
+        from poker_dream_docs.manifest import DEFAULT_CLIENT
+        client = {**DEFAULT_CLIENT, **(job.get('client') or {})}
+        client.pop('output', None)
+        return client
+    return {}
+
+def run_job(job):
+    """Build one document in a worker process and return its path and timing
+
+    With job['render_cache'] ({'dir', 'max_bytes'}), documents already rendered
+    from the same code and inputs are copied from the cache instead; cached
+    documents are always saved reproducibly, others when job['reproducible'].
+    Jobs with job['pdf'] export their Document as PDF.
+    """
+    start = time.perf_counter()
+    output_path = job['output_path']
+    cache = job.get('render_cache')
+
+    if job.get('pdf'):
+        from poker_dream_docs.pdf_export import render_pdf
+        render = lambda: render_pdf(build_job(job))
+    else:
+        render = lambda: save_document(build_job(job), reproducible=True if cache else job.get('reproducible'))
+
+    if cache:
+        from poker_dream_docs.render_cache import cached_render
+        builder = f"{job['builder']}.pdf" if job.get('pdf') else job['builder']
+        data, hit = cached_render(cache['dir'], builder, job_inputs(job), render, cache['max_bytes'])
+    else:
+        data, hit = render(), None
+    save_bytes(data, output_path)
+
+    return {
+        'name': job['name'],
+        'builder': job['builder'],
+        'output_path': output_path,
+        'seconds': time.perf_counter() - start,
+        'pid': os.getpid(),
+        'cache_hit': hit,
+    }
+
+def plan_jobs(output_dir, builders=None, manifest=None, render_cache=None, reproducible=None, pdf=False,
+              deck_workers=1):
+    """List the jobs for the selected builders plus one per manifest client
+
+    With pdf, the Word documents are exported as PDF instead of .docx.
+    deck_workers is passed to the deck build for spreading a large deck's
+    slides over its own worker processes. Raises ValueError if two jobs
+    would write the same file, since they would run concurrently.
+    """
+    jobs = []
+    for builder in builders or BUILDERS:
+        jobs.append({
+            'name': builder,
+            'builder': builder,
+            'output_path': os.path.join(output_dir, BUILDERS[builder]),
+        })
+
+    if manifest:
+        from poker_dream_docs.manifest import load_manifest, output_filename
+        for index, client in enumerate(load_manifest(manifest)):
+            filename = output_filename(client, index)
+            jobs.append({
+                'name': f'proposal:{filename}',
+                'builder': 'proposal',
+                'client': client,
+                'row': index + 1,
+                'output_path': os.path.join(output_dir, filename),
+            })
+
+    for job in jobs:
+        job['reproducible'] = reproducible
+        if job['builder'] == 'pptx':
+            job['deck_workers'] = deck_workers
+        if pdf and job['builder'] != 'pptx':
+            from poker_dream_docs.pdf_export import pdf_filename
+            job['pdf'] = True
+            job['output_path'] = pdf_filename(job['output_path'])
+        if render_cache:
+            job['render_cache'] = render_cache
+
+    owners = {}
+    errors = []
+    for job in jobs:
+        owner = f"manifest row {job['row']}" if 'row' in job else f"builder {job['name']}"
+        path = os.path.normcase(os.path.abspath(job['output_path']))
+        if path in owners:
+            errors.append(f"{owner}: output {job['output_path']} already used by {owners[path]}")
+        owners.setdefault(path, owner)
+    if errors:
+        raise ValueError('\n'.join(errors))
+    return jobs
+
+def render_all(jobs, workers=None):
+    """Run jobs across a process pool and return results in job order"""
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Render Poker Dream documents in parallel')
+    parser.add_argument('--output-dir', default='.', help='Directory for generated files')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes')
+    parser.add_argument('--builders', nargs='*', choices=sorted(BUILDERS), default=None,
+                        help='Builders to run (default: all)')
+    parser.add_argument('--manifest', help='CSV or JSONL client manifest for proposal variants')
+    parser.add_argument('--report', help='Write per-job timings as JSON to this path')
+    parser.add_argument('--render-cache', help='Reuse documents rendered from the same inputs in this directory')
+    parser.add_argument('--render-cache-size', type=int, default=512, help='Render cache size limit in MiB')
+    parser.add_argument('--reproducible', action='store_true', default=None,
+                        help='Pin timestamps so identical content gives identical bytes (default: on if SOURCE_DATE_EPOCH is set)')
+    parser.add_argument('--pdf', action='store_true', help='Export the Word documents as PDF instead of .docx')
+    parser.add_argument('--deck-workers', type=int, default=1,
+                        help='Worker processes for building the slides of a large deck')
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    render_cache = None
+    if args.render_cache:
+        render_cache = {'dir': args.render_cache, 'max_bytes': args.render_cache_size * 1024 * 1024}
+    try:
+        jobs = plan_jobs(args.output_dir, args.builders, args.manifest, render_cache, args.reproducible, args.pdf,
+                         args.deck_workers)
+    except ValueError as e:
+        parser.exit(1, f'{e}\n')
+
+    start = time.perf_counter()
+    results = render_all(jobs, args.workers)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        cached = {True: '  (cached)', False: '', None: ''}[result['cache_hit']]
+        print(f"{result['seconds']:8.3f}s  {result['name']}  ->  {result['output_path']}{cached}")
+    print(f'{len(results)} documents in {elapsed:.3f}s with {args.workers} workers')
+
+    report = {'workers': args.workers, 'seconds': elapsed, 'jobs': results}
+    if render_cache:
+        hits = sum(1 for result in results if result['cache_hit'])
+        report['render_cache'] = {'hits': hits, 'misses': len(results) - hits}
+        print(f'render cache: {hits} hits, {len(results) - hits} misses')
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
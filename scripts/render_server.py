@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Long-running document rendering server
+Keeps python-docx, python-pptx and the brand templates loaded in a bounded
+pool of worker processes and renders documents on request over HTTP (TCP or
+a Unix socket):
+
+    POST /render/proposal   {"client": {...manifest fields...}}
+    POST /render/website    {}
+    POST /render/pptx       {}
+    GET  /health
+
+Responses carry the generated file bytes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+import argparse
+import json
+import os
+import threading
+
+import create_pptx
+import create_proposal_docx
+import create_website_proposal_docx
+from poker_dream_docs.manifest import validate_manifest
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+PPTX_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+# Builder name -> (content type, download file name)
+BUILDERS = {
+    'proposal': (DOCX_TYPE, 'POKER_DREAM_PROPOSAL.docx'),
+    'website': (DOCX_TYPE, 'Poker_Dream_Website_Proposal.docx'),
+    'pptx': (PPTX_TYPE, 'Poker_Dream_Ecosystem.pptx'),
+}
+
+def render(builder, payload, deck_workers=1):
+    """Render one document in a worker process and return its bytes"""
+    if builder == 'proposal':
+        return create_proposal_docx.create_proposal(payload.get('client'), output=None)
+    if builder == 'website':
+        return create_website_proposal_docx.create_website_proposal(None)
+    if builder == 'pptx':
+        return create_pptx.create_presentation(None, workers=deck_workers)
+    raise ValueError(f'Unknown builder: {builder}')
+
+def warm_up():
+    """Render each builder once so every import and base template is loaded"""
+    for builder in BUILDERS:
+        render(builder, {})
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """Serve render requests from the server's worker pool"""
+
+    server_version = 'PokerDreamRender/1.0'
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.send_json(200, {'status': 'ok', 'builders': sorted(BUILDERS)})
+        else:
+            self.send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        prefix = '/render/'
+        builder = self.path[len(prefix):] if self.path.startswith(prefix) else None
+        if builder not in BUILDERS:
+            self.send_json(404, {'error': f'unknown builder: {builder}'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self.send_json(400, {'error': f'invalid JSON: {e}'})
+            return
+        if not isinstance(payload, dict):
+            self.send_json(400, {'error': 'request body must be a JSON object'})
+            return
+        errors = validate_manifest([payload['client']]) if payload.get('client') is not None else []
+        if errors:
+            self.send_json(400, {'error': 'invalid client', 'details': errors})
+            return
+
+        # Reject instead of queueing without bound when all slots are taken
+        if not self.server.slots.acquire(blocking=False):
+            self.send_json(503, {'error': 'server busy'})
+            return
+        try:
+            data = self.server.executor.submit(render, builder, payload, self.server.deck_workers).result()
+        except Exception as e:
+            self.send_json(500, {'error': str(e)})
+            return
+        finally:
+            self.server.slots.release()
+
+        content_type, filename = BUILDERS[builder]
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """HTTP over a Unix domain socket"""
+
+    daemon_threads = True
+
+def serve(host='127.0.0.1', port=8765, socket_path=None, workers=None, max_pending=None, deck_workers=1):
+    """Start the worker pool and serve requests until interrupted
+
+    deck_workers > 1 lets a large deck spread its slides over that many
+    extra processes.
+    """
+    workers = workers or os.cpu_count()
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+    # Start and warm every worker before accepting the first request
+    for future in [executor.submit(os.getpid) for _ in range(workers)]:
+        future.result()
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, RenderHandler)
+        address = socket_path
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+        address = f'http://{host}:{server.server_address[1]}'
+
+    server.executor = executor
+    server.deck_workers = deck_workers
+    server.slots = threading.BoundedSemaphore(max_pending or workers * 4)
+    print(f'Serving {", ".join(sorted(BUILDERS))} on {address} with {workers} workers')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        executor.shutdown()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve Poker Dream document renders over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on')
+    parser.add_argument('--socket', help='Listen on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of render worker processes')
+    parser.add_argument('--max-pending', type=int, help='Requests allowed in flight before answering 503')
+    parser.add_argument('--deck-workers', type=int, default=1,
+                        help='Worker processes for building the slides of a large deck')
+    args = parser.parse_args()
+    serve(args.host, args.port, args.socket, args.workers, args.max_pending, args.deck_workers)
+
+if __name__ == '__main__':
+    main()